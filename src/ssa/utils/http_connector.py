@@ -13,27 +13,247 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from typing import Any
+import json
+import logging
+import socket
+import sys
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from functools import lru_cache, partial
+from typing import Any, ClassVar
+from urllib.parse import urlencode, urlsplit
 
 import requests
 from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.exceptions import ConnectTimeoutError, NameResolutionError, NewConnectionError
+from urllib3.util.connection import allowed_gai_family, create_connection
 from urllib3.util.retry import Retry
 
 from ssa.utils.logger import Logger as custom_logger
 
+# Probe idle pooled connections so they aren't silently dropped by proxies/NATs,
+# which would otherwise turn a keep-alive reuse into a failed request and a reconnect
+_KEEPALIVE_SOCKET_OPTIONS = [
+    *HTTPConnection.default_socket_options,
+    (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+]
+if hasattr(socket, "TCP_KEEPIDLE"):
+    _KEEPALIVE_SOCKET_OPTIONS += [
+        (socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, 60),
+        (socket.IPPROTO_TCP, socket.TCP_KEEPINTVL, 10),
+        (socket.IPPROTO_TCP, socket.TCP_KEEPCNT, 3),
+    ]
+
+# Addresses resolved for the connections opened by connectors created with dns_cache_ttl,
+# shared by all of them and stored as (resolved at, getaddrinfo result). Lookups made
+# anywhere else in the process never go through it.
+_DNS_CACHE_SIZE = 1024
+_dns_cache: OrderedDict[tuple, tuple[float, list]] = OrderedDict()
+_dns_lock = threading.Lock()
+
+
+def _resolve(host: str, port: int, ttl: float) -> list:
+    """
+    Resolves a host for a new connection, reusing a lookup made less than ttl seconds ago.
+
+    socket.getaddrinfo is looked up on each miss, so resolvers patched in later
+    (gevent, eventlet, test doubles) are still used.
+
+    Args:
+        host (str): The host name to resolve.
+        port (int): The port to connect to.
+        ttl (float): Seconds a previous lookup is reused.
+
+    Returns:
+        List: The getaddrinfo entries for the host, as a copy the caller may modify.
+    """
+    key = (host, port, allowed_gai_family())
+    with _dns_lock:
+        entry = _dns_cache.get(key)
+        if entry is not None and time.monotonic() - entry[0] < ttl:
+            _dns_cache.move_to_end(key)
+            return list(entry[1])
+
+    result = socket.getaddrinfo(host, port, key[2], socket.SOCK_STREAM)
+    with _dns_lock:
+        _dns_cache[key] = (time.monotonic(), list(result))
+        _dns_cache.move_to_end(key)
+        if len(_dns_cache) > _DNS_CACHE_SIZE:
+            _dns_cache.popitem(last=False)
+    return result
+
+
+def _forget(host: str, port: int) -> None:
+    """Drops the cached addresses of a host, so the next connection resolves it again."""
+    with _dns_lock:
+        _dns_cache.pop((host, port, allowed_gai_family()), None)
+
+
+def _dumps(obj: Any) -> bytes:
+    """Serializes a payload to compact UTF-8 JSON bytes, rejecting NaN and Infinity."""
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False, allow_nan=False).encode()
+
+
+class _CachedDNSMixin:
+    """Connection mixin that opens its socket to addresses resolved through the DNS cache."""
+
+    def __init__(self, *args, dns_cache_ttl: float, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.dns_cache_ttl = dns_cache_ttl
+
+    def _new_conn(self) -> socket.socket:
+        """
+        Connects to the first reachable cached address of the host, like urllib3 does with a fresh lookup.
+
+        Returns:
+            socket.socket: The connected socket.
+        """
+        host = self.host.strip("[]")
+        try:
+            addresses = _resolve(host, self.port, self.dns_cache_ttl)
+        except socket.gaierror as e:
+            raise NameResolutionError(self.host, self, e) from e
+
+        error = None
+        for *_, address in addresses:
+            try:
+                sock = create_connection(
+                    (address[0], self.port),
+                    self.timeout,
+                    source_address=self.source_address,
+                    socket_options=self.socket_options,
+                )
+            except OSError as e:
+                error = e
+                continue
+            sys.audit("http.client.connect", self, self.host, self.port)
+            return sock
+
+        # The cached addresses may be stale, so the next connection looks the host up again
+        _forget(host, self.port)
+        if isinstance(error, TimeoutError):
+            raise ConnectTimeoutError(
+                self, f"Connection to {self.host} timed out. (connect timeout={self.timeout})"
+            ) from error
+        raise NewConnectionError(self, f"Failed to establish a new connection: {error}") from error
+
+
+class _CachedDNSHTTPConnection(_CachedDNSMixin, HTTPConnection):
+    pass
+
+
+class _CachedDNSHTTPSConnection(_CachedDNSMixin, HTTPSConnection):
+    pass
+
+
+class _CachedDNSHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = _CachedDNSHTTPConnection
+
+
+class _CachedDNSHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = _CachedDNSHTTPSConnection
+
+
+class _KeepAliveAdapter(HTTPAdapter):
+    """
+    HTTPAdapter whose pooled connections have TCP keep-alive enabled and, when
+    dns_cache_ttl is set, reuse resolved host addresses for that many seconds.
+    """
+
+    __attrs__: ClassVar[list[str]] = [*HTTPAdapter.__attrs__, "_dns_cache_ttl"]
+
+    def __init__(self, *args, dns_cache_ttl: float = 0.0, **kwargs):
+        # Set first, since HTTPAdapter.__init__ builds the pool manager
+        self._dns_cache_ttl = dns_cache_ttl
+        super().__init__(*args, **kwargs)
+
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs.setdefault("socket_options", _KEEPALIVE_SOCKET_OPTIONS)
+        super().init_poolmanager(*args, **kwargs)
+        if self._dns_cache_ttl > 0:
+            # Requests sent through a proxy keep the default pools, resolving the proxy as usual
+            self.poolmanager.pool_classes_by_scheme = {
+                "http": partial(_CachedDNSHTTPConnectionPool, dns_cache_ttl=self._dns_cache_ttl),
+                "https": partial(_CachedDNSHTTPSConnectionPool, dns_cache_ttl=self._dns_cache_ttl),
+            }
+
+
+class PreparedCall:
+    """
+    A request template created by HTTPConnector.prepare.
+
+    Attributes:
+        url (str): The URL of the endpoint, without query parameters.
+    """
+
+    def __init__(
+        self,
+        connector: "HTTPConnector",
+        template: requests.PreparedRequest,
+        settings: dict[str, Any],
+    ):
+        """
+        Initializes the PreparedCall.
+
+        Args:
+            connector (HTTPConnector): The connector used to send the requests.
+            template (requests.PreparedRequest): The request with URL and headers merged.
+            settings (Dict[str, Any]): Proxies, TLS and streaming settings for the session.
+        """
+        self.url = template.url
+        self._connector = connector
+        self._template = template
+        self._settings = settings
+
+    def send(
+        self,
+        params: dict[str, Any] | None = None,
+        data: dict[str, Any] | None = None,
+    ) -> requests.Response:
+        """
+        Sends the request, with the same retry and error handling as HTTPConnector.request.
+
+        Args:
+            params (Optional[Dict[str, Any]]): Query parameters for the request.
+            data (Optional[Dict[str, Any]]): The JSON payload for the request.
+
+        Returns:
+            requests.Response: The response from the server.
+        """
+        prepared = self._template.copy()
+        if params:
+            prepared.prepare_url(self.url, params)
+        if data is not None:
+            prepared.prepare_body(_dumps(data), None)
+        return self._connector._send(prepared, self._settings)
+
 
 class HTTPConnector:
     """
     A class to handle HTTP requests, including parallel requests.
 
+    It can be used as a context manager, closing its session and worker threads on exit:
+
+        with HTTPConnector("https://api.example.com") as connector:
+            connector.get("status")
+
     Attributes:
         base_url (str): The base URL for the API.
         auth_token (Optional[str]): The authentication token for the API.
         retry_strategy (Retry): The retry strategy for failed requests.
-        session (requests.Session): The session object for making requests.
+        session (requests.Session): The session object for making requests. Its connection
+            pool is shared with other connectors to the same host with the same settings.
     """
 
+    # Adapters (connection pools) shared by connectors with the same host and transport
+    # settings, with the number of open connectors using each one
+    _adapters: ClassVar[dict[tuple, list]] = {}
+    _adapters_lock: ClassVar[threading.Lock] = threading.Lock()
+
     def __init__(
         self,
         base_url: str,
@@ -43,6 +263,9 @@ class HTTPConnector:
         backoff_factor: float = 0.3,
         status_forcelist: list[int] | None = None,
         log_level: int = "WARNING",
+        max_workers: int = 32,
+        etag_cache_size: int = 128,
+        dns_cache_ttl: float = 0.0,
     ):
         """
         Initializes the HttpClient.
@@ -52,11 +275,19 @@ class HTTPConnector:
             headers (Optional[Dict[str, str]]): Default headers to be sent with every request.
             auth_token (Optional[str]): The authentication token for the API.
             max_retries (int): Maximum number of retries for failed requests.
-            backoff_factor (float): Factor to apply between attempts.
+            backoff_factor (float): Factor to apply between attempts, plus a random
+                jitter of up to half of it so parallel callers don't retry in lock-step.
                 {backoff factor} * (2 ** ({number of total retries} - 1))
             status_forcelist (Optional[List[int]]): List of status codes that
                 should trigger a retry.
             log_level (int): Logging level for the client (default: logging.INFO)
+            max_workers (int): Number of threads used by the parallel requests, which is
+                also the size of the connection pool kept for each host.
+            etag_cache_size (int): Number of GET responses kept for conditional requests
+                (If-None-Match / If-Modified-Since). Set to 0 to disable the cache.
+            dns_cache_ttl (float): Seconds to reuse resolved host addresses for new connections
+                opened by this connector. The cache lives in the connector's connection pool,
+                so no other lookup in the process is affected. Disabled by default.
             custom_handler (Optional[logging.Handler]): Custom logging handler to add
                 (e.g., NewRelic handler)
         """
@@ -64,9 +295,22 @@ class HTTPConnector:
         self.logger.info("Initializing HttpClient with base_url: %s", base_url)
 
         self.base_url = base_url.rstrip("/")
+        self._url_prefix = self.base_url + "/"
         self.auth_token = auth_token
         self.default_headers = headers or {}
 
+        # Headers shared by every request, built once instead of on each call.
+        # Payloads are serialized before reaching requests, so Content-Type is set here.
+        self._base_headers = {
+            "Content-Type": "application/json",  # Default if not provided
+            "Accept": "application/json",  # Default value if not provided
+            **self.default_headers,
+        }
+        self._auth_headers = {"Authorization": f"Bearer {auth_token}"} if auth_token else {}
+        self._base_headers.update(self._auth_headers)
+        # Merged headers per set of additional headers, reused by repeated calls
+        self._merge_headers = lru_cache(maxsize=256)(self._build_headers)
+
         # Configure retry strategy
         if status_forcelist is None:
             status_forcelist = [
@@ -78,19 +322,47 @@ class HTTPConnector:
                 504,  # Gateway Timeout
             ]
 
+        self._retry_statuses = frozenset(status_forcelist)
+
         self.retry_strategy = Retry(
             total=max_retries,
             backoff_factor=backoff_factor,
+            backoff_jitter=backoff_factor * 0.5,
             status_forcelist=status_forcelist,
             allowed_methods=["GET", "POST", "PUT", "PATCH", "DELETE"],
+            respect_retry_after_header=True,
         )
 
-        # Create session with retry strategy
+        # Connectors to the same host with the same settings share one adapter, so its
+        # pooled connections (and the DNS/TLS work behind them) serve all of them. Each
+        # connector keeps its own session, so cookies, headers and hooks aren't shared.
+        url = urlsplit(self.base_url)
+        self._adapter_key = (
+            url.scheme,
+            url.netloc,
+            max_retries,
+            backoff_factor,
+            tuple(status_forcelist),
+            max_workers,
+            dns_cache_ttl,
+        )
         self.session = requests.Session()
-        adapter = HTTPAdapter(max_retries=self.retry_strategy)
+        adapter = self._acquire_adapter(max_workers, dns_cache_ttl)
         self.session.mount("http://", adapter)
         self.session.mount("https://", adapter)
 
+        # Executor shared by all parallel requests made through this client
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="httpc")
+
+        # GET requests being sent, joined by identical calls made meanwhile
+        self._inflight: dict[tuple, Future] = {}
+        self._inflight_lock = threading.Lock()
+
+        # LRU of validated GET responses, keyed by URL + sorted query string + headers
+        self._etag_cache: OrderedDict[tuple, requests.Response] = OrderedDict()
+        self._etag_cache_size = etag_cache_size
+        self._etag_lock = threading.Lock()
+
         self.logger.debug(
             "Retry configuration: max_retries=%d, backoff_factor=%f, status_forcelist=%s",
             max_retries,
@@ -98,6 +370,44 @@ class HTTPConnector:
             status_forcelist,
         )
 
+    def _acquire_adapter(self, max_workers: int, dns_cache_ttl: float) -> HTTPAdapter:
+        """
+        Returns the adapter shared by connectors with the same settings, creating it on first use.
+
+        Args:
+            max_workers (int): Number of pooled connections kept for each host.
+            dns_cache_ttl (float): Seconds the adapter's connections reuse resolved addresses.
+
+        Returns:
+            HTTPAdapter: The shared adapter.
+        """
+        with self._adapters_lock:
+            entry = self._adapters.get(self._adapter_key)
+            if entry is None:
+                # Keep as many pooled connections per host as there are workers
+                # so parallel requests don't queue on the pool
+                adapter = _KeepAliveAdapter(
+                    pool_connections=max_workers,
+                    pool_maxsize=max_workers,
+                    max_retries=self.retry_strategy,
+                    dns_cache_ttl=dns_cache_ttl,
+                )
+                entry = self._adapters[self._adapter_key] = [adapter, 0]
+            entry[1] += 1
+            return entry[0]
+
+    @classmethod
+    def close_all(cls) -> None:
+        """
+        Closes the connection pools shared by all connectors. Connectors created afterwards get new pools.
+        """
+        with cls._adapters_lock:
+            adapters = [adapter for adapter, _ in cls._adapters.values()]
+            cls._adapters.clear()
+
+        for adapter in adapters:
+            adapter.close()
+
     def _get_headers(self, headers: dict[str, str] | None = None) -> dict[str, str]:
         """
         Generates the headers for the requests.
@@ -106,20 +416,39 @@ class HTTPConnector:
             headers (Optional[Dict[str, str]]): Additional headers to include.
 
         Returns:
-            Dict[str, str]: The headers dictionary.
+            Dict[str, str]: The headers dictionary. It is shared with other calls using
+                the same headers and must not be modified.
         """
-        headers = {
-            "Content-Type": "application/json",  # Default if not provided
-            "Accept": "application/json",  # Default value if not provided
-            **self.default_headers,
-            **(headers or {}),
-        }
-        if self.auth_token:
-            headers["Authorization"] = f"Bearer {self.auth_token}"
+        headers = self._merge_headers(frozenset(headers.items())) if headers else self._base_headers
 
-        self.logger.debug("Generated headers: %s", headers)
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("Generated headers: %s", headers)
         return headers
 
+    def _build_headers(self, headers: frozenset[tuple[str, str]]) -> dict[str, str]:
+        """
+        Merges additional headers into the base headers, keeping the authorization header.
+
+        Args:
+            headers (FrozenSet[Tuple[str, str]]): The additional header items.
+
+        Returns:
+            Dict[str, str]: The merged headers dictionary.
+        """
+        return {**self._base_headers, **dict(headers), **self._auth_headers}
+
+    def _url(self, endpoint: str) -> str:
+        """
+        Joins an endpoint to the base URL.
+
+        Args:
+            endpoint (str): The endpoint, with or without leading slashes.
+
+        Returns:
+            str: The full URL of the endpoint.
+        """
+        return self._url_prefix + endpoint.lstrip("/")
+
     def request(
         self,
         method: str,
@@ -147,56 +476,156 @@ class HTTPConnector:
             requests.exceptions.RequestException: For network-related errors or exceeded retries.
             requests.exceptions.HTTPError: For HTTP error responses (4xx, 5xx).
         """
-        url = f"{self.base_url}/{endpoint.lstrip('/')}"
-        self.logger.info("Making %s request to: %s", method, url)
-        if params:
+        return self._request(method, endpoint, params, data, self._get_headers(headers))
+
+    def _request(
+        self,
+        method: str,
+        endpoint: str,
+        params: dict[str, Any] | None,
+        data: dict[str, Any] | None,
+        headers: dict[str, str],
+    ) -> requests.Response:
+        """
+        Sends a request with headers that are already merged with the connector's defaults.
+
+        Args:
+            method (str): The HTTP method to use.
+            endpoint (str): The endpoint to send the request to.
+            params (Optional[Dict[str, Any]]): Query parameters for the request.
+            data (Optional[Dict[str, Any]]): The JSON payload for the request.
+            headers (Dict[str, str]): The complete headers of the request.
+
+        Returns:
+            requests.Response: The response from the server.
+        """
+        url = self._url(endpoint)
+        # Per-request records are DEBUG only: at INFO they would serialize the parallel
+        # workers on the handler lock, and batches already log a summary
+        debug = self.logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            self.logger.debug("Making %s request to: %s", method, url)
+        if debug and params:
             self.logger.debug("Request parameters: %s", params)
-        if data:
+        if debug and data:
             self.logger.debug("Request payload: %s", data)
 
         try:
             response = self.session.request(
                 method=method,
                 url=url,
-                headers=self._get_headers(headers),
+                headers=headers,
                 params=params,
-                data=data,
-            )
-            self.logger.info(
-                "Request to %s/%s returned response status code: %d",
-                self.base_url,
-                endpoint,
-                response.status_code,
+                data=None if data is None else _dumps(data),
             )
-            self.logger.debug("Response headers: %s", dict(response.headers))
-
-            if response.status_code >= 400:
-                if response.status_code in self.retry_strategy.status_forcelist:
-                    self.logger.warning(
-                        "Request to %s/%s failed with retryable status code %d: %s",
-                        self.base_url,
-                        endpoint,
-                        response.status_code,
-                        response.text,
-                    )
-                    # Let the retry mechanism handle it
-                    return response
-                else:
-                    self.logger.error(
-                        "Request to %s/%s failed with non-retryable status code %d: %s",
-                        self.base_url,
-                        endpoint,
-                        response.status_code,
-                        response.text,
-                    )
-                    response.raise_for_status()
+            return self._check_response(url, response, debug)
 
-            return response
+        except requests.exceptions.RequestException as e:
+            self.logger.error("Request to %s failed: %s", url, e)
+            raise
+
+    def prepare(
+        self,
+        method: str,
+        endpoint: str,
+        headers: dict[str, str] | None = None,
+    ) -> "PreparedCall":
+        """
+        Builds a reusable request for an endpoint that is called repeatedly (e.g. polling).
+
+        The URL, headers, session cookies and environment settings are merged once, so
+        every PreparedCall.send only fills in the query parameters and payload.
+
+        Args:
+            method (str): The HTTP method to use (GET, POST, PUT, PATCH, DELETE).
+            endpoint (str): The endpoint to send the requests to.
+            headers (Optional[Dict[str, str]]): Additional headers to include.
+
+        Returns:
+            PreparedCall: The request template bound to this connector.
+        """
+        url = self._url(endpoint)
+        template = self.session.prepare_request(
+            requests.Request(method=method, url=url, headers=self._get_headers(headers))
+        )
+        settings = self.session.merge_environment_settings(template.url, {}, None, None, None)
+        return PreparedCall(self, template, settings)
+
+    def _send(self, prepared: requests.PreparedRequest, settings: dict[str, Any]) -> requests.Response:
+        """
+        Sends an already prepared request through the session.
+
+        Args:
+            prepared (requests.PreparedRequest): The request to send.
+            settings (Dict[str, Any]): Proxies, TLS and streaming settings for the request.
+
+        Returns:
+            requests.Response: The response from the server.
+        """
+        debug = self.logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            self.logger.debug("Making %s request to: %s", prepared.method, prepared.url)
+        try:
+            response = self.session.send(prepared, **settings)
+            return self._check_response(prepared.url, response, debug)
 
         except requests.exceptions.RequestException as e:
-            self.logger.error("Request to %s/%s failed: %s", self.base_url, endpoint, str(e))
+            self.logger.error("Request to %s failed: %s", prepared.url, e)
             raise
 
+    def _check_response(self, url: str, response: requests.Response, debug: bool) -> requests.Response:
+        """
+        Logs a response and raises for non-retryable error statuses.
+
+        Args:
+            url (str): The requested URL.
+            response (requests.Response): The response from the server.
+            debug (bool): Whether debug logging is enabled.
+
+        Returns:
+            requests.Response: The same response.
+
+        Raises:
+            requests.exceptions.HTTPError: For non-retryable HTTP error responses (4xx, 5xx).
+        """
+        if debug:
+            self.logger.debug("Request to %s returned response status code: %d", url, response.status_code)
+            self.logger.debug("Response headers: %r", response.headers)
+
+        # The body isn't logged to avoid decoding it here
+        if response.status_code >= 400:
+            if response.status_code in self._retry_statuses:
+                # Only reached when the Retry adapter didn't retry it, e.g. for methods
+                # outside allowed_methods, so it isn't returned silently
+                self.logger.warning(
+                    "Request to %s failed with retryable status code %d",
+                    url,
+                    response.status_code,
+                )
+                return response
+
+            self.logger.error(
+                "Request to %s failed with non-retryable status code %d",
+                url,
+                response.status_code,
+            )
+            response.raise_for_status()
+
+        return response
+
+    @staticmethod
+    def json(response: requests.Response) -> Any:
+        """
+        Decodes the JSON body of a response.
+
+        Args:
+            response (requests.Response): The response to decode.
+
+        Returns:
+            Any: The decoded JSON document.
+        """
+        return json.loads(response.content)
+
     def get(
         self,
         endpoint: str,
@@ -206,6 +635,14 @@ class HTTPConnector:
         """
         Makes a GET request to the specified endpoint.
 
+        Identical GET requests (same endpoint, parameters and headers) that are already
+        in flight are not sent again: callers wait for the pending request and share
+        its response.
+
+        Responses carrying an ETag or Last-Modified header are kept in an in-memory
+        LRU cache. Subsequent calls send them back as conditional headers, and a
+        304 Not Modified answer returns the cached response without a new body.
+
         Args:
             endpoint (str): The endpoint to send the GET request to.
             params (Optional[Dict[str, Any]]): Query parameters for the request.
@@ -213,7 +650,100 @@ class HTTPConnector:
         Returns:
             requests.Response: The response from the server.
         """
-        return self.request("GET", endpoint, headers=headers, params=params)
+        # Both the in-flight requests and the ETag cache are keyed on the URL, query and
+        # headers, so different representations or credentials are never mixed up
+        query = urlencode(sorted((params or {}).items()), doseq=True)
+        key = (f"{endpoint.lstrip('/')}?{query}", frozenset(headers.items()) if headers else None)
+        with self._inflight_lock:
+            pending = self._inflight.get(key)
+            if pending is None:
+                future = self._inflight[key] = Future()
+
+        if pending is not None:
+            self.logger.debug("Joining in-flight GET request to: %s", endpoint)
+            return pending.result()
+
+        try:
+            response = self._get(endpoint, key, headers, params)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(response)
+        finally:
+            with self._inflight_lock:
+                del self._inflight[key]
+        return response
+
+    def _get(
+        self,
+        endpoint: str,
+        key: tuple,
+        headers: dict[str, str] | None,
+        params: dict[str, Any] | None,
+    ) -> requests.Response:
+        """
+        Sends a GET request, revalidating a cached response when there is one.
+
+        Args:
+            endpoint (str): The endpoint to send the GET request to.
+            key (Tuple): The cache key of the request.
+            headers (Optional[Dict[str, str]]): Additional headers to include.
+            params (Optional[Dict[str, Any]]): Query parameters for the request.
+
+        Returns:
+            requests.Response: The response from the server, or the cached one if unchanged.
+        """
+        if not self._etag_cache_size:
+            return self.request("GET", endpoint, headers=headers, params=params)
+
+        with self._etag_lock:
+            cached = self._etag_cache.get(key)
+
+        if cached is None:
+            response = self.request("GET", endpoint, headers=headers, params=params)
+        else:
+            # Validators change with every revision, so they're added after the memoized
+            # header merge instead of filling its cache with single-use entries.
+            # Conditional headers passed by the caller take precedence.
+            merged = dict(self._get_headers(headers))
+            if "ETag" in cached.headers:
+                merged.setdefault("If-None-Match", cached.headers["ETag"])
+            if "Last-Modified" in cached.headers:
+                merged.setdefault("If-Modified-Since", cached.headers["Last-Modified"])
+            response = self._request("GET", endpoint, params, None, merged)
+
+        if response.status_code == 304 and cached is not None:
+            self.logger.debug("Resource %s not modified, using cached response", endpoint)
+            with self._etag_lock:
+                if key in self._etag_cache:
+                    self._etag_cache.move_to_end(key)
+            return cached
+
+        self._cache_response(key, response)
+        return response
+
+    def _cache_response(self, key: tuple, response: requests.Response) -> None:
+        """
+        Stores a GET response in the conditional request cache when it can be revalidated.
+
+        Args:
+            key (Tuple): The cache key of the request.
+            response (requests.Response): The response to store.
+        """
+        if response.status_code != 200:
+            return
+        if "ETag" not in response.headers and "Last-Modified" not in response.headers:
+            return
+        # no-cache still allows storing, as every cached entry is revalidated anyway
+        if "no-store" in response.headers.get("Cache-Control", ""):
+            return
+
+        with self._etag_lock:
+            self._etag_cache[key] = response
+            self._etag_cache.move_to_end(key)
+            while len(self._etag_cache) > self._etag_cache_size:
+                self._etag_cache.popitem(last=False)
 
     def post(
         self,
@@ -309,7 +839,12 @@ class HTTPConnector:
                 dictionaries for each request.
 
         Returns:
-            List[requests.Response]: A list of responses from the server.
+            List[requests.Response]: A list of responses from the server, in the same
+                order as the endpoints.
+
+        Raises:
+            Exception: The first error raised by any of the requests. Requests that
+                haven't started yet are cancelled.
         """
         self.logger.info("Making %d parallel %s requests", len(endpoints), method)
         if headers_list is None:
@@ -319,26 +854,44 @@ class HTTPConnector:
         if data_list is None:
             data_list = [None] * len(endpoints)
 
-        responses = []
-        with ThreadPoolExecutor() as executor:
-            futures = {
-                executor.submit(self.request, method, endpoint, data=data): endpoint
-                for endpoint, data in zip(endpoints, data_list, strict=True)
-            }
-            for future in as_completed(futures):
-                endpoint = futures[future]
-                try:
-                    response = future.result()
-                    responses.append(response)
-                    self.logger.debug("Successfully completed %s request to: %s", method, endpoint)
-                except Exception as e:
-                    self.logger.error(
-                        "Failed to complete %s request to %s: %s",
-                        method,
-                        endpoint,
-                        str(e),
-                    )
-                    raise
+        responses: list[requests.Response | None] = [None] * len(endpoints)
+        # GETs go through get() so duplicated endpoints share one request and the ETag cache
+        futures = {
+            (
+                self._executor.submit(self.get, endpoint, headers=headers, params=params)
+                if method == "GET" and data is None
+                else self._executor.submit(
+                    self.request, method, endpoint, params=params, data=data, headers=headers
+                )
+            ): index
+            for index, (endpoint, headers, params, data) in enumerate(
+                zip(endpoints, headers_list, params_list, data_list, strict=True)
+            )
+        }
+        # Per-request records are only emitted at DEBUG level, the batch is summarized once
+        debug = self.logger.isEnabledFor(logging.DEBUG)
+        completed = 0
+        for future in as_completed(futures):
+            index = futures[future]
+            try:
+                responses[index] = future.result()
+                completed += 1
+                if debug:
+                    self.logger.debug("Successfully completed %s request to: %s", method, endpoints[index])
+            except Exception as e:
+                self.logger.error(
+                    "Failed to complete %s request to %s after %d/%d requests completed: %s",
+                    method,
+                    endpoints[index],
+                    completed,
+                    len(endpoints),
+                    e,
+                )
+                for pending in futures:
+                    pending.cancel()
+                raise
+
+        self.logger.info("Completed %d/%d parallel %s requests", completed, len(endpoints), method)
         return responses
 
     def get_multiple(
@@ -379,7 +932,7 @@ class HTTPConnector:
         Returns:
             List[requests.Response]: A list of responses from the server.
         """
-        return self._request_multiple("POST", endpoints, headers_list, data_list)
+        return self._request_multiple("POST", endpoints, headers_list, data_list=data_list)
 
     def put_multiple(
         self,
@@ -398,7 +951,7 @@ class HTTPConnector:
         Returns:
             List[requests.Response]: A list of responses from the server.
         """
-        return self._request_multiple("PUT", endpoints, headers_list, data_list)
+        return self._request_multiple("PUT", endpoints, headers_list, data_list=data_list)
 
     def patch_multiple(
         self,
@@ -417,7 +970,7 @@ class HTTPConnector:
         Returns:
             List[requests.Response]: A list of responses from the server.
         """
-        return self._request_multiple("PATCH", endpoints, headers_list, data_list)
+        return self._request_multiple("PATCH", endpoints, headers_list, data_list=data_list)
 
     def delete_multiple(
         self,
@@ -436,7 +989,31 @@ class HTTPConnector:
         Returns:
             List[requests.Response]: A list of responses from the server.
         """
-        return self._request_multiple("DELETE", endpoints, headers_list, data_list)
+        return self._request_multiple("DELETE", endpoints, headers_list, data_list=data_list)
 
     def close(self):
+        """
+        Waits for the parallel request workers to stop and closes the session. The pooled
+        connections are closed once no other connector is using the same adapter.
+        """
+        self._executor.shutdown(wait=True)
+
+        with self._adapters_lock:
+            key, self._adapter_key = self._adapter_key, None
+            if key is None:  # already closed
+                return
+            entry = self._adapters.get(key)
+            if entry is not None:
+                entry[1] -= 1
+                if entry[1] > 0:
+                    # Detach the pool still used by other connectors before closing the session
+                    self.session.adapters.clear()
+                else:
+                    del self._adapters[key]
         self.session.close()
+
+    def __enter__(self) -> "HTTPConnector":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
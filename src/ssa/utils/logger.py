@@ -15,6 +15,8 @@
 
 import logging
 
+_FORMATTER = logging.Formatter("%(asctime)s level=%(levelname)-7s - %(name)s.%(funcName)s(): %(message)s")
+
 
 class Logger:
     """
@@ -68,19 +70,64 @@ class Logger:
 
         logger = logging.getLogger(name)
         logger.setLevel(level)
-        formatter = logging.Formatter(
-            "%(asctime)s level=%(levelname)-7s - %(name)s.%(funcName)s(): %(message)s"
-        )
 
-        logger.propagate = False
-        logger.handlers.clear()
+        # Handlers are installed only the first time a logger name is requested,
+        # so creating many instances of the same class doesn't churn handlers
+        if not getattr(logger, "_ssa_configured", False):
+            logger.propagate = False
+            logger.handlers.clear()
 
-        console_handler = logging.StreamHandler()
-        console_handler.setFormatter(formatter)
-        logger.addHandler(console_handler)
+            console_handler = logging.StreamHandler()
+            console_handler.setFormatter(_FORMATTER)
+            logger.addHandler(console_handler)
+            logger._ssa_configured = True
 
-        if custom_handler:
-            custom_handler.setFormatter(formatter)
+        if custom_handler and not Logger._has_handler(logger, custom_handler):
+            custom_handler.setFormatter(_FORMATTER)
             logger.addHandler(custom_handler)
 
         return logger
+
+    @staticmethod
+    def _has_handler(logger: logging.Logger, handler: logging.Handler) -> bool:
+        """
+        Checks whether a logger already has a handler, or one of the same type writing
+        to the same stream, so repeated calls don't duplicate every record.
+
+        Args:
+            logger: The logger to inspect
+            handler: The handler about to be added
+
+        Returns:
+            bool: True if an equivalent handler is already attached
+        """
+        stream = getattr(handler, "stream", None)
+        return any(
+            existing is handler
+            or (stream is not None and type(existing) is type(handler) and existing.stream is stream)
+            for existing in logger.handlers
+        )
+
+    @staticmethod
+    def skip_thread_and_process_info() -> None:
+        """
+        Stops collecting thread and process details on every log record, which the format
+        used by this class doesn't include.
+
+        This changes the logging module flags for the whole process, so every logger and
+        handler loses those fields. Only call it from applications that don't need them.
+        """
+        logging.logThreads = False
+        logging.logProcesses = False
+        logging.logMultiprocessing = False
+
+    @staticmethod
+    def reset() -> None:
+        """
+        Removes the handlers installed by this class, so the next call configures
+        the loggers from scratch. Mostly useful for tests.
+        """
+        for logger in list(logging.Logger.manager.loggerDict.values()):
+            if getattr(logger, "_ssa_configured", False):
+                logger.handlers.clear()
+                logger._ssa_configured = False
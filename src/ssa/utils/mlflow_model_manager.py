@@ -13,19 +13,133 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
+import importlib
+import os
+import tempfile
+import threading
+import time
 import warnings
-from typing import Any
-
+from collections import OrderedDict
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache, partial
+from operator import attrgetter
+from typing import TYPE_CHECKING, Any, ClassVar
+
+import cloudpickle
 import mlflow
-import mlflow.pyfunc
-import mlflow.pytorch
-import mlflow.sklearn
-import mlflow.tensorflow
-from mlflow.pyfunc import PyFuncModel
+from mlflow.entities import Metric, Param, RunTag
+from mlflow.exceptions import MlflowException
 from mlflow.tracking import MlflowClient
+from mlflow.tracking.context.registry import resolve_tags
 
 from ssa.utils.logger import Logger as custom_logger
 
+# Flavor modules pull in their frameworks (torch, tensorflow, sklearn), so they're imported on use
+# through MLflowModelManager._flavor
+if TYPE_CHECKING:
+    from mlflow.pyfunc import PyFuncModel
+
+# ModelVersion fields exposed by list_versions and get_model_by_alias, read in one C-level call
+_VERSION_KEYS = ("version", "run_id", "status", "creation_timestamp", "aliases")
+_VERSION_GETTER = attrgetter(*_VERSION_KEYS)
+_ALIAS_KEYS = ("version", "run_id", "status", "aliases")
+_ALIAS_GETTER = attrgetter(*_ALIAS_KEYS)
+
+# Flavors logged with mlflow.<flavor>.log_model, mapped to the keyword their model is passed as
+# (None for positional) and the keyword their extra code paths are passed as (None if unsupported)
+_FLAVOR_ARGUMENTS = {
+    "sklearn": (None, None),
+    "pytorch": (None, "code_paths"),
+    "tensorflow": (None, None),
+    "pyfunc": ("python_model", "code_path"),
+}
+
+# URI of the model logged by log_model inside a run; registry URIs are built from per-instance prefixes
+_RUN_MODEL_URI = "runs:/{}/model"
+
+# Artifact uploads are bound by per-request latency rather than bandwidth, so more can overlap
+# than the 8 workers used for small registry calls
+_MAX_UPLOAD_WORKERS = 16
+
+
+def _quote_filter_value(value: str) -> str:
+    """
+    Quotes a string literal for an MLFlow search filter.
+
+    MLFlow strips the surrounding quotes of a literal without unescaping it, so values
+    containing single quotes are wrapped in double quotes instead.
+
+    Args:
+        value: String to quote.
+
+    Returns:
+        The quoted literal.
+
+    Raises:
+        ValueError: If the value contains both single and double quotes.
+    """
+    if "'" not in value:
+        return f"'{value}'"
+    if '"' in value:
+        raise ValueError(f"Value can't be quoted in an MLFlow search filter: {value}")
+    return f'"{value}"'
+
+
+def _dispose_store_engines(client: MlflowClient) -> None:
+    """
+    Closes the pooled database connections of a client's tracking and registry stores.
+
+    MlflowClient has no public way to do this, so the stores are reached through MLFlow
+    private attributes (_tracking_client, _registry_client_lazy, store, engine). Stores
+    without an engine (REST, file) or MLFlow versions where these attributes differ are
+    skipped, leaving their connections to be closed when they're garbage collected.
+
+    Args:
+        client: Client whose store engines are disposed.
+    """
+    engines = []
+    # The registry client is created lazily; it's only looked at if it already exists
+    for attribute in ("_tracking_client", "_registry_client_lazy"):
+        try:
+            engine = getattr(getattr(client, attribute).store, "engine", None)
+        except Exception:  # noqa: S112 - private API, missing or failing attributes are skipped
+            continue
+        if engine is not None and not any(engine is seen for seen in engines):
+            engines.append(engine)
+
+    for engine in engines:
+        engine.dispose()
+
+
+@lru_cache(maxsize=64)
+def _resolve_experiment_id(tracking_uri: str, name: str, artifact_location: str | None) -> str:
+    """
+    Returns the ID of an MLFlow experiment, creating it only if it doesn't exist yet.
+
+    Results are cached per tracking server, so repeated manager constructions for the
+    same experiment don't hit the server again.
+
+    Args:
+        tracking_uri: URI of the tracking server the experiment lives on (cache key only).
+        name: Name of the experiment.
+        artifact_location: Artifact location used if the experiment has to be created.
+
+    Returns:
+        String containing the experiment ID.
+    """
+    experiment = mlflow.get_experiment_by_name(name)
+    if experiment is not None:
+        return experiment.experiment_id
+
+    try:
+        return mlflow.create_experiment(name, artifact_location=artifact_location)
+    except MlflowException as e:
+        # Another process created it between the lookup and the create call
+        if e.error_code != "RESOURCE_ALREADY_EXISTS":
+            raise
+        return mlflow.get_experiment_by_name(name).experiment_id
+
 
 class MLflowModelManager:
     """
@@ -43,6 +157,34 @@ class MLflowModelManager:
         experiment_id: ID of the MLFlow experiment (None if registry-only mode)
     """
 
+    # Managers are often created per tenant or model, so instances carry no __dict__
+    __slots__ = (
+        "_alias_cache",
+        "_alias_cache_ttl",
+        "_alias_uri_prefix",
+        "_cache_lock",
+        "_cache_size",
+        "_model_cache",
+        "_model_cache_size",
+        "_model_cache_ttl",
+        "_pending_batches",
+        "_pending_lock",
+        "_version_filter",
+        "_version_uri_prefix",
+        "client",
+        "experiment_id",
+        "experiment_name",
+        "logger",
+        "model_name",
+    )
+
+    # Flavor modules imported so far, shared by all managers
+    _flavors: ClassVar[dict[str, Any]] = {}
+
+    # One client per tracking server, so managers share its stores and their connection pools
+    _clients: ClassVar[dict[str, MlflowClient]] = {}
+    _clients_lock: ClassVar[threading.Lock] = threading.Lock()
+
     def __init__(
         self,
         model_name: str,
@@ -50,6 +192,12 @@ class MLflowModelManager:
         tracking_uri: str | None = None,
         artifact_location: str | None = None,
         log_level: str = "WARNING",
+        http_pool_size: int | None = None,
+        http_max_retries: int | None = None,
+        cache_size: int = 32,
+        model_cache_size: int = 0,
+        model_cache_ttl: float = 300.0,
+        alias_cache_ttl: float = 30.0,
     ):
         """
         Initializes the MLFlow Model Manager.
@@ -62,28 +210,62 @@ class MLflowModelManager:
             tracking_uri: URI of remote MLFlow tracking server. If None, uses local tracking.
             artifact_location: Custom location for storing artifacts (S3, GCS, etc).
             log_level: Logging verbosity level. One of: DEBUG, INFO, WARNING, ERROR, CRITICAL.
+            http_pool_size: Size of the keep-alive connection pool MLFlow uses for REST calls.
+                           Exported as MLFLOW_HTTP_POOL_CONNECTIONS/MAXSIZE, which are
+                           process-wide: the first value set wins (including one already in the
+                           environment), later managers asking for a different value only get a
+                           warning, and MLFlow reads them once before its first request.
+                           If None, MLFlow's default is kept.
+            http_max_retries: Retries MLFlow's shared session makes on transient errors (429, 5xx).
+                             Same rules as http_pool_size apply.
+            cache_size: Maximum number of alias lookups kept in memory.
+            model_cache_size: Maximum number of loaded models kept in memory. Models can be
+                             large, so caching them is opt-in: 0 (the default) disables it.
+            model_cache_ttl: Seconds a loaded model is reused before it's fetched again.
+            alias_cache_ttl: Seconds an alias lookup is reused before the registry is queried again.
         """
         self.logger = custom_logger.get_logger(log_level=log_level, caller=self)
 
+        # MLFlow caches one pooled requests.Session per process and reads its settings from these
+        if http_pool_size:
+            self._set_mlflow_env("MLFLOW_HTTP_POOL_CONNECTIONS", http_pool_size)
+            self._set_mlflow_env("MLFLOW_HTTP_POOL_MAXSIZE", http_pool_size)
+        if http_max_retries is not None:
+            self._set_mlflow_env("MLFLOW_HTTP_REQUEST_MAX_RETRIES", http_max_retries)
+
         self.experiment_name = experiment_name
         self.model_name = model_name
-        self.client = MlflowClient(tracking_uri=tracking_uri)
+        self.client = self._get_client(tracking_uri)
+
+        # Registry filter and URI prefixes only depend on the model name, so build them once
+        self._version_filter = f"name={_quote_filter_value(model_name)}"
+        self._version_uri_prefix = f"models:/{model_name}/"
+        self._alias_uri_prefix = f"models:/{model_name}@"
+
+        # In-process LRU caches with expiry, holding (expiry time, value) entries
+        self._cache_size = cache_size
+        self._model_cache_size = model_cache_size
+        self._model_cache_ttl = model_cache_ttl
+        self._alias_cache_ttl = alias_cache_ttl
+        self._model_cache: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+        self._alias_cache: OrderedDict[str, tuple[float, dict[str, Any]]] = OrderedDict()
+        self._cache_lock = threading.Lock()
+
+        # RunOperations of batches logged with async_log=True, waited on by flush_logging
+        self._pending_batches: list[Any] = []
+        self._pending_lock = threading.Lock()
 
         if tracking_uri:
             mlflow.set_tracking_uri(tracking_uri)
 
         if experiment_name:
-            try:
-                self.experiment_id = mlflow.create_experiment(
-                    experiment_name, artifact_location=artifact_location
-                )
-                self.logger.debug(f"Created new experiment: {experiment_name}")
-            except Exception:
-                self.experiment_id = mlflow.get_experiment_by_name(experiment_name).experiment_id
-                self.logger.debug(f"Using existing experiment: {experiment_name} (ID: {self.experiment_id})")
+            self.experiment_id = _resolve_experiment_id(
+                mlflow.get_tracking_uri(), experiment_name, artifact_location
+            )
+            self.logger.debug("Using experiment: %s (ID: %s)", experiment_name, self.experiment_id)
 
             mlflow.set_experiment(experiment_name)
-            self.logger.info(f"MLFlow experiment configured: {experiment_name}")
+            self.logger.info("MLFlow experiment configured: %s", experiment_name)
         else:
             self.experiment_id = None
             self.logger.info("Initialized in registry-only mode (no experiment configured)")
@@ -102,6 +284,7 @@ class MLflowModelManager:
         input_example: Any | None = None,
         pip_requirements: list[str] | None = None,
         code_paths: list[str] | None = None,
+        async_log: bool = False,
     ) -> str:
         """
         Logs a trained model along with its parameters and metrics to MLFlow.
@@ -115,7 +298,8 @@ class MLflowModelManager:
                        - "pytorch": PyTorch models
                        - "tensorflow": TensorFlow/Keras models
                        - "pyfunc": Custom MLFlow PyFunc models
-                       - "custom": Generic Python objects (saved as pickle)
+                       - "custom": Generic Python objects (saved with cloudpickle; loading
+                         dynamically defined objects such as lambdas needs cloudpickle too)
             use_autolog: If True, uses MLFlow's autolog feature to automatically capture
                         model artifacts, parameters, and metrics. Only works with
                         sklearn, pytorch, and tensorflow. Ignored for pyfunc and custom.
@@ -126,6 +310,9 @@ class MLflowModelManager:
             input_example: Sample input data for documentation and validation.
             pip_requirements: List of pip packages required to load the model.
             code_paths: List of Python files to include with the model.
+            async_log: If True, returns without waiting for params, metrics and tags to reach
+                      the tracking server. They're sent by MLFlow's background logging
+                      thread; call flush_logging() to wait for them.
 
         Returns:
             String containing the MLFlow run ID for this logged model.
@@ -139,15 +326,9 @@ class MLflowModelManager:
 
         # Enable autolog if requested and supported
         if use_autolog:
-            if model_type == "sklearn":
-                mlflow.sklearn.autolog()
-                self.logger.debug("Enabled sklearn autolog")
-            elif model_type == "pytorch":
-                mlflow.pytorch.autolog()
-                self.logger.debug("Enabled pytorch autolog")
-            elif model_type == "tensorflow":
-                mlflow.tensorflow.autolog()
-                self.logger.debug("Enabled tensorflow autolog")
+            if model_type in ("sklearn", "pytorch", "tensorflow"):
+                self._flavor(model_type).autolog()
+                self.logger.debug("Enabled %s autolog", model_type)
             else:
                 warnings.warn(
                     f"Autolog not supported for model_type '{model_type}'.Falling back to manual logging",
@@ -155,67 +336,59 @@ class MLflowModelManager:
                     stacklevel=2,
                 )
 
-        with mlflow.start_run(run_name=run_name) as run:
-            if params:
-                mlflow.log_params(params)
-            if metrics:
-                mlflow.log_metrics(metrics)
+        # Context tags (user, source name/type, git commit) are what mlflow.start_run adds to new runs;
+        # start_run(run_id=...) below only resumes the run, so they're resolved here
+        run_id = self.client.create_run(
+            self.experiment_id, tags=resolve_tags(), run_name=run_name
+        ).info.run_id
 
-            if tags:
-                mlflow.set_tags(tags)
+        try:
+            # Queued on MLflow's async logging worker so the model upload below doesn't wait on it
+            pending_batch = None
+            if params or metrics or tags:
+                pending_batch = self._log_batch(run_id, params=params, metrics=metrics, tags=tags)
 
             if artifacts:
-                for name, path in artifacts.items():
-                    mlflow.log_artifact(path, name=name)
-
-            if model_type == "sklearn":
-                mlflow.sklearn.log_model(
-                    model,
-                    name="model",
-                    signature=signature,
-                    input_example=input_example,
-                    pip_requirements=pip_requirements,
-                )
-
-            elif model_type == "pytorch":
-                mlflow.pytorch.log_model(
-                    model,
-                    name="model",
-                    signature=signature,
-                    input_example=input_example,
-                    pip_requirements=pip_requirements,
-                    code_paths=code_paths,
-                )
-
-            elif model_type == "tensorflow":
-                mlflow.tensorflow.log_model(
-                    model,
-                    name="model",
-                    signature=signature,
-                    input_example=input_example,
-                    pip_requirements=pip_requirements,
-                )
-
-            elif model_type == "pyfunc":
-                mlflow.pyfunc.log_model(
-                    name="model",
-                    python_model=model,
-                    signature=signature,
-                    input_example=input_example,
-                    pip_requirements=pip_requirements,
-                    code_path=code_paths,
-                )
+                # Uploads go through the client with an explicit run ID, which is safe across threads
+                with ThreadPoolExecutor(max_workers=min(_MAX_UPLOAD_WORKERS, len(artifacts))) as executor:
+                    futures = [
+                        executor.submit(self.client.log_artifact, run_id, path, artifact_path=name)
+                        for name, path in artifacts.items()
+                    ]
+                    for future in as_completed(futures):
+                        future.result()
+
+            flavor_arguments = _FLAVOR_ARGUMENTS.get(model_type)
+            if flavor_arguments is not None:
+                model_arg, code_paths_arg = flavor_arguments
+                args = () if model_arg else (model,)
+                kwargs = {
+                    "name": "model",
+                    "signature": signature,
+                    "input_example": input_example,
+                    "pip_requirements": pip_requirements,
+                }
+                if model_arg:
+                    kwargs[model_arg] = model
+                if code_paths_arg:
+                    kwargs[code_paths_arg] = code_paths
+
+                # Flavor log_model functions have no run_id argument, so they get the run activated
+                # only for their call; everything else goes through the client with an explicit run ID
+                with mlflow.start_run(run_id=run_id):
+                    self._flavor(model_type).log_model(*args, **kwargs)
 
             elif model_type == "custom":
-                import pickle
-                import tempfile
-                from pathlib import Path
-
+                # The upload keeps the file's base name, so it's written as model.pkl
+                # inside a temporary directory rather than as a randomly named temp file
                 with tempfile.TemporaryDirectory() as tmp_dir:
-                    tmp_path = Path(tmp_dir) / "model.pkl"
+                    tmp_path = os.path.join(tmp_dir, "model.pkl")
+                    # cloudpickle also handles closures and lambdas, which then need cloudpickle
+                    # installed to be unpickled; protocol 5 frames large buffers (numpy/torch)
+                    # without extra in-memory copies
                     with open(tmp_path, "wb") as f:
-                        pickle.dump(model, f)
-                    mlflow.log_artifact(str(tmp_path), artifact_path="model")
+                        cloudpickle.dump(model, f, protocol=cloudpickle.DEFAULT_PROTOCOL)
+                    self.client.log_artifact(run_id, tmp_path, artifact_path="model")
 
             else:
                 raise ValueError(
@@ -223,10 +396,113 @@ class MLflowModelManager:
                     "Supported types: sklearn, pytorch, tensorflow, pyfunc or custom"
                 )
 
-            run_id = run.info.run_id
-            self.logger.info(f"Model logged successfully (run_id: {run_id})")
+            if pending_batch is not None:
+                if async_log:
+                    with self._pending_lock:
+                        self._pending_batches.append(pending_batch)
+                else:
+                    pending_batch.wait()
+        except BaseException:
+            self.client.set_terminated(run_id, status="FAILED")
+            raise
 
-            return run_id
+        self.client.set_terminated(run_id)
+        self.logger.info("Model logged successfully (run_id: %s)", run_id)
+
+        return run_id
+
+    @classmethod
+    def _get_client(cls, tracking_uri: str | None) -> MlflowClient:
+        """
+        Returns the MlflowClient shared by all managers using the same tracking server.
+
+        Args:
+            tracking_uri: URI of the tracking server. If None, MLFlow's current tracking URI is used.
+
+        Returns:
+            The cached MlflowClient for the tracking server, created on first use.
+        """
+        key = tracking_uri or mlflow.get_tracking_uri()
+        with cls._clients_lock:
+            client = cls._clients.get(key)
+            if client is None:
+                client = cls._clients[key] = MlflowClient(tracking_uri=tracking_uri)
+            return client
+
+    @classmethod
+    def close_all(cls) -> None:
+        """
+        Releases the clients shared by all managers.
+
+        Database-backed (SQLAlchemy) tracking and registry stores have their engines
+        disposed, closing their pooled connections. Managers created afterwards get new clients.
+        """
+        with cls._clients_lock:
+            clients = list(cls._clients.values())
+            cls._clients.clear()
+
+        for client in clients:
+            _dispose_store_engines(client)
+
+    @classmethod
+    def _flavor(cls, name: str) -> Any:
+        """
+        Imports an MLFlow flavor module on first use.
+
+        Flavor modules import their ML framework (torch, tensorflow, sklearn), so they're
+        only loaded when a model of that type is logged or loaded.
+
+        Args:
+            name: Flavor name, e.g. "sklearn", "pytorch", "tensorflow" or "pyfunc".
+
+        Returns:
+            The mlflow.<name> module.
+        """
+        flavor = cls._flavors.get(name)
+        if flavor is None:
+            flavor = cls._flavors[name] = importlib.import_module(f"mlflow.{name}")
+        return flavor
+
+    def flush_logging(self) -> None:
+        """
+        Blocks until all params, metrics and tags queued by this manager's
+        log_model(async_log=True) calls have been sent to its tracking server.
+        """
+        with self._pending_lock:
+            pending, self._pending_batches = self._pending_batches, []
+        for batch in pending:
+            batch.wait()
+
+    def _log_batch(
+        self,
+        run_id: str,
+        params: dict[str, Any] | None = None,
+        metrics: dict[str, float] | None = None,
+        tags: dict[str, str] | None = None,
+    ) -> Any:
+        """
+        Logs params, metrics and tags of a run in a single asynchronous log_batch request.
+
+        MlflowClient splits the batch further when it exceeds the server limits
+        (100 params/tags and 1000 metrics per request).
+
+        Args:
+            run_id: The MLFlow run ID to log to.
+            params: Dictionary of hyperparameters.
+            metrics: Dictionary of evaluation metrics.
+            tags: Dictionary of run tags.
+
+        Returns:
+            RunOperations handle. Call its wait() method to block until the batch is logged.
+        """
+        timestamp = int(time.time() * 1000)
+        return self.client.log_batch(
+            run_id,
+            metrics=[Metric(key, float(value), timestamp, 0) for key, value in (metrics or {}).items()],
+            params=[Param(key, str(value)) for key, value in (params or {}).items()],
+            tags=[RunTag(key, str(value)) for key, value in (tags or {}).items()],
+            synchronous=False,
+        )
 
     def register_model(
         self,
@@ -250,24 +526,28 @@ class MLflowModelManager:
         Returns:
             String containing the registered version number (e.g., "1", "2", "3").
         """
-        model_uri = f"runs:/{run_id}/model"
+        model_uri = _RUN_MODEL_URI.format(run_id)
 
-        model_version = mlflow.register_model(model_uri, self.model_name)
+        # Tags travel with the create request instead of one set_model_version_tag call each
+        model_version = mlflow.register_model(model_uri, self.model_name, tags=tags)
         version = model_version.version
 
-        self.logger.info(f"Registered model: {self.model_name} version {version}")
+        self.logger.info("Registered model: %s version %s", self.model_name, version)
 
+        # The description and alias are independent updates of the new version, so
+        # when both are given they are sent concurrently instead of back to back
+        updates = []
         if description:
-            self.client.update_model_version(name=self.model_name, version=version, description=description)
-            self.logger.debug(f"Set description for version {version}")
-
-        if tags:
-            for key, value in tags.items():
-                self.client.set_model_version_tag(name=self.model_name, version=version, key=key, value=value)
-            self.logger.debug(f"Set {len(tags)} tags for version {version}")
-
+            updates.append(partial(self.update_description, version=version, description=description))
         if alias:
-            self.set_alias(version=version, alias=alias)
+            updates.append(partial(self.set_alias, version=version, alias=alias))
+
+        if len(updates) > 1:
+            with ThreadPoolExecutor(max_workers=len(updates)) as executor:
+                for future in as_completed([executor.submit(update) for update in updates]):
+                    future.result()
+        elif updates:
+            updates[0]()
 
         return version
 
@@ -276,7 +556,7 @@ class MLflowModelManager:
         version: str | None = None,
         alias: str | None = None,
         run_id: str | None = None,
-    ) -> PyFuncModel:
+    ) -> "PyFuncModel":
         """
         Loads a model from the MLFlow Model Registry.
 
@@ -295,23 +575,114 @@ class MLflowModelManager:
         Raises:
             ValueError: If none or multiple identifiers are provided.
         """
-        if sum([version is not None, alias is not None, run_id is not None]) != 1:
+        if (version is not None) + (alias is not None) + (run_id is not None) != 1:
             raise ValueError("Must specify exactly one of: version, alias, or run_id")
 
         if run_id:
-            model_uri = f"runs:/{run_id}/model"
+            model_uri = _RUN_MODEL_URI.format(run_id)
         elif version:
-            model_uri = f"models:/{self.model_name}/{version}"
-        elif alias:
-            model_uri = f"models:/{self.model_name}@{alias}"
+            model_uri = self._version_uri_prefix + str(version)
+        else:
+            # Aliases are resolved to their current version, so the cache is keyed on an immutable
+            # URI and moving an alias makes the next load pick up the new version
+            resolved = self.get_model_by_alias(alias)
+            if resolved is not None:
+                model_uri = self._version_uri_prefix + str(resolved["version"])
+            else:
+                model_uri = self._alias_uri_prefix + alias
+
+        model = self._cache_get(self._model_cache, model_uri)
+        if model is not None:
+            self.logger.debug("Model served from cache: %s", model_uri)
+            return model
 
-        self.logger.debug(f"Loading model from: {model_uri}")
+        self.logger.debug("Loading model from: %s", model_uri)
 
-        model = mlflow.pyfunc.load_model(model_uri)
+        model = self._flavor("pyfunc").load_model(model_uri)
+        self._cache_put(self._model_cache, model_uri, model, self._model_cache_ttl, self._model_cache_size)
         self.logger.info("Model loaded successfully")
 
         return model
 
+    def _set_mlflow_env(self, name: str, value: int) -> None:
+        """
+        Exports an MLFlow setting unless it's already set, warning when the existing value differs.
+
+        Args:
+            name: Environment variable read by MLFlow.
+            value: Value requested for this manager.
+        """
+        current = os.environ.setdefault(name, str(value))
+        if current != str(value):
+            self.logger.warning(
+                "%s is already set to %s process-wide, ignoring requested value %s", name, current, value
+            )
+
+    def _cache_get(self, cache: OrderedDict, key: Any) -> Any | None:
+        """
+        Returns a cached value if it hasn't expired, marking it as recently used.
+
+        Args:
+            cache: One of the manager caches.
+            key: Cache key to look up.
+
+        Returns:
+            The cached value, or None if it's missing or expired.
+        """
+        with self._cache_lock:
+            entry = cache.get(key)
+            if entry is None:
+                return None
+            if entry[0] <= time.monotonic():
+                del cache[key]
+                return None
+            cache.move_to_end(key)
+            return entry[1]
+
+    def _cache_put(self, cache: OrderedDict, key: Any, value: Any, ttl: float, max_size: int) -> None:
+        """
+        Stores a value in a cache, dropping expired entries and evicting the least recently
+        used one when full.
+
+        Expired entries are released here rather than left until their key is looked up
+        again, so values that are never requested twice don't stay in memory.
+
+        Args:
+            cache: One of the manager caches.
+            key: Cache key to store the value under.
+            value: Value to cache.
+            ttl: Seconds until the value expires.
+            max_size: Maximum number of entries in the cache. Nothing is stored if it's 0.
+        """
+        if max_size <= 0:
+            return
+        now = time.monotonic()
+        with self._cache_lock:
+            for expired in [k for k, (expires_at, _) in cache.items() if expires_at <= now]:
+                del cache[expired]
+            cache[key] = (now + ttl, value)
+            cache.move_to_end(key)
+            if len(cache) > max_size:
+                cache.popitem(last=False)
+
+    def invalidate_cache(self, alias: str | None = None) -> None:
+        """
+        Discards cached alias lookups and, if no alias is given, cached models too.
+
+        Called automatically after registry writes made through this manager. Call it
+        manually when the registry is changed from elsewhere and stale entries matter.
+
+        Args:
+            alias: Only forget the version this alias resolved to. Cached models are kept,
+                  since they're keyed by version or run and never go stale.
+        """
+        with self._cache_lock:
+            if alias is not None:
+                self._alias_cache.pop(alias, None)
+                return
+            self._model_cache.clear()
+            self._alias_cache.clear()
+
     def set_alias(self, version: str, alias: str) -> None:
         """
         Sets or updates an alias for a specific model version.
@@ -324,7 +695,8 @@ class MLflowModelManager:
             alias: Alias name to set
         """
         self.client.set_registered_model_alias(name=self.model_name, alias=alias, version=version)
-        self.logger.info(f"Set alias '{alias}' to version {version}")
+        self.invalidate_cache(alias)
+        self.logger.info("Set alias '%s' to version %s", alias, version)
 
     def delete_alias(self, alias: str) -> None:
         """
@@ -336,12 +708,27 @@ class MLflowModelManager:
             alias: Name of the alias to remove.
         """
         self.client.delete_registered_model_alias(name=self.model_name, alias=alias)
-        self.logger.info(f"Deleted alias: {alias}")
+        self.invalidate_cache(alias)
+        self.logger.info("Deleted alias: %s", alias)
 
-    def list_versions(self) -> list[dict[str, Any]]:
+    def list_versions(
+        self,
+        filter_string: str | None = None,
+        order_by: list[str] | None = None,
+        max_results: int | None = None,
+    ) -> list[dict[str, Any]]:
         """
         Lists all registered versions of the model with their metadata.
 
+        Filtering, ordering and limits are applied by the tracking server, so only
+        the requested versions are transferred.
+
+        Args:
+            filter_string: Optional extra search condition, e.g. "tags.stage = 'candidate'".
+                          It's combined with the model name condition using AND.
+            order_by: Optional list of order clauses, e.g. ["version_number DESC"].
+            max_results: Optional maximum number of versions to return.
+
         Returns:
             List of dictionaries, each containing:
             - version: Version number
@@ -350,46 +737,154 @@ class MLflowModelManager:
             - creation_timestamp: Unix timestamp of when version was created
             - aliases: List of aliases assigned to this version
         """
-        versions = self.client.search_model_versions(f"name='{self.model_name}'")
-
         result = [
-            {
-                "version": v.version,
-                "run_id": v.run_id,
-                "status": v.status,
-                "creation_timestamp": v.creation_timestamp,
-                "aliases": v.aliases if hasattr(v, "aliases") else [],
-            }
-            for v in versions
+            dict(zip(_VERSION_KEYS, _VERSION_GETTER(v), strict=True))
+            for v in self._iter_versions(filter_string, order_by, max_results)
         ]
 
-        self.logger.debug(f"Found {len(result)} versions")
+        self.logger.debug("Found %d versions", len(result))
+        return result
+
+    def list_versions_columnar(
+        self,
+        filter_string: str | None = None,
+        order_by: list[str] | None = None,
+        max_results: int | None = None,
+    ) -> dict[str, list[Any]]:
+        """
+        Lists all registered versions of the model as one list per field.
+
+        Cheaper than list_versions for large registries when callers scan a single
+        field (e.g. every run_id), since no dictionary is built per version.
+
+        Args:
+            filter_string: Optional extra search condition, see list_versions.
+            order_by: Optional list of order clauses, see list_versions.
+            max_results: Optional maximum number of versions to return.
+
+        Returns:
+            Dictionary with the same keys as the list_versions entries (version, run_id,
+            status, creation_timestamp, aliases), each mapping to a list with one value
+            per version, in the same order.
+        """
+        # Transposes the per-version field tuples; an empty registry still gets every column
+        versions = self._iter_versions(filter_string, order_by, max_results)
+        columns = list(zip(*map(_VERSION_GETTER, versions), strict=True))
+        if not columns:
+            columns = [()] * len(_VERSION_KEYS)
+        result = {key: list(column) for key, column in zip(_VERSION_KEYS, columns, strict=True)}
+
+        self.logger.debug("Found %d versions", len(result["version"]))
         return result
 
+    def _iter_versions(
+        self,
+        filter_string: str | None = None,
+        order_by: list[str] | None = None,
+        max_results: int | None = None,
+    ) -> Iterator[Any]:
+        """
+        Yields registered versions of the model, fetching result pages as needed.
+
+        Args:
+            filter_string: Optional extra search condition, combined with the model name using AND.
+            order_by: Optional list of order clauses.
+            max_results: Optional maximum number of versions to yield.
+
+        Returns:
+            Iterator over MLFlow ModelVersion objects.
+        """
+        if filter_string:
+            filter_string = f"{self._version_filter} AND {filter_string}"
+        else:
+            filter_string = self._version_filter
+
+        remaining = max_results
+        page_token = None
+        while remaining is None or remaining > 0:
+            page = self.client.search_model_versions(
+                filter_string=filter_string,
+                max_results=1000 if remaining is None else min(1000, remaining),
+                order_by=order_by,
+                page_token=page_token,
+            )
+            yield from page
+            if remaining is not None:
+                remaining -= len(page)
+            page_token = page.token
+            if not page_token:
+                break
+
     def get_model_by_alias(self, alias: str) -> dict[str, Any] | None:
         """
         Retrieves metadata for the model version with a specific alias.
 
+        Only registry metadata is fetched; no model artifacts are downloaded.
+
         Args:
             alias: Alias name to look up.
 
         Returns:
             Dictionary with version metadata if found, None if alias doesn't exist.
             Dictionary contains: version, run_id, status, aliases
+
+        Raises:
+            MlflowException: If the registry lookup fails for a reason other than a missing alias.
+        """
+        result = self._lookup_alias(alias)
+        if result is None:
+            self.logger.error("Alias '%s' not found", alias)
+            return None
+        return dict(result)
+
+    def _lookup_alias(self, alias: str) -> dict[str, Any] | None:
         """
+        Returns the cached metadata of the version with an alias, fetching and caching it on a miss.
+
+        Args:
+            alias: Alias name to look up.
+
+        Returns:
+            The cached metadata dictionary, which must not be modified, or None if the
+            alias doesn't exist.
+
+        Raises:
+            MlflowException: If the registry lookup fails for a reason other than a missing alias.
+        """
+        cached = self._cache_get(self._alias_cache, alias)
+        if cached is not None:
+            return cached
+
         try:
             v = self.client.get_model_version_by_alias(self.model_name, alias)
-            return {
-                "version": v.version,
-                "run_id": v.run_id,
-                "status": v.status,
-                "aliases": v.aliases if hasattr(v, "aliases") else [],
-            }
-
-        except Exception as e:
-            self.logger.error(f"Alias '{alias}' not found: {e}")
+        except MlflowException as e:
+            if e.error_code != "RESOURCE_DOES_NOT_EXIST":
+                raise
             return None
 
+        result = dict(zip(_ALIAS_KEYS, _ALIAS_GETTER(v), strict=True))
+        self._cache_put(self._alias_cache, alias, result, self._alias_cache_ttl, self._cache_size)
+        return result
+
+    def alias_exists(self, alias: str) -> bool:
+        """
+        Checks whether an alias is currently assigned to a version of the model.
+
+        A metadata-only registry lookup, much cheaper than calling load_model just to
+        see whether the alias resolves. The result is cached like get_model_by_alias, so
+        a following load_model(alias=...) doesn't query the registry again.
+
+        Args:
+            alias: Alias name to check.
+
+        Returns:
+            True if the alias exists, False otherwise.
+
+        Raises:
+            MlflowException: If the registry lookup fails for any other reason.
+        """
+        return self._lookup_alias(alias) is not None
+
     def promote_to_production(self, version: str) -> None:
         """
         Promotes a model version to production by setting the 'production' alias.
@@ -401,7 +896,7 @@ class MLflowModelManager:
             version: Version number to promote.
         """
         self.set_alias(version=version, alias="production")
-        self.logger.info(f"Promoted version {version} to production")
+        self.logger.info("Promoted version %s to production", version)
 
     def promote_to_staging(self, version: str) -> None:
         """
@@ -413,7 +908,37 @@ class MLflowModelManager:
             version: Version number to promote.
         """
         self.set_alias(version=version, alias="staging")
-        self.logger.info(f"Promoted version {version} to staging")
+        self.logger.info("Promoted version %s to staging", version)
+
+    def promote_many(self, assignments: dict[str, str]) -> None:
+        """
+        Sets several aliases at once, sending the registry calls concurrently.
+
+        MlflowClient registry calls are independent stateless REST requests, so they
+        can be issued from multiple threads. Useful when a pipeline promotes versions
+        to production and staging in the same step.
+
+        Args:
+            assignments: Dictionary mapping each alias to the version number it's assigned
+                        to, e.g. {"production": "5", "staging": "6"}. A version can receive
+                        several aliases in the same call.
+        """
+        if not assignments:
+            return
+
+        with ThreadPoolExecutor(max_workers=min(8, len(assignments))) as executor:
+            futures = [
+                executor.submit(
+                    self.client.set_registered_model_alias, name=self.model_name, alias=alias, version=version
+                )
+                for alias, version in assignments.items()
+            ]
+            for future in as_completed(futures):
+                future.result()
+
+        for alias in assignments:
+            self.invalidate_cache(alias)
+        self.logger.info("Set %d aliases: %s", len(assignments), assignments)
 
     def delete_version(self, version: str) -> None:
         """
@@ -426,7 +951,8 @@ class MLflowModelManager:
             version: Version number to delete.
         """
         self.client.delete_model_version(name=self.model_name, version=version)
-        self.logger.info(f"Deleted version {version}")
+        self.invalidate_cache()
+        self.logger.info("Deleted version %s", version)
 
     def update_description(self, version: str, description: str) -> None:
         """
@@ -437,4 +963,4 @@ class MLflowModelManager:
             description: New description text.
         """
         self.client.update_model_version(name=self.model_name, version=version, description=description)
-        self.logger.info(f"Updated description for version {version}")
+        self.logger.info("Updated description for version %s", version)
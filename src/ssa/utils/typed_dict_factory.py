@@ -14,20 +14,13 @@
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
 import logging
-from dataclasses import dataclass
 
 
-@dataclass(frozen=True)
 class ImmutableDict(dict):
     """A custom immutable dictionary."""
 
-    def __new__(cls, *args, **kwargs):
-        instance = super().__new__(cls, *args, **kwargs)
-        dict.__init__(instance, *args, **kwargs)
-        return instance
-
-    def __init__(self, *args, **kwargs):
-        pass  # No need to initialize here, it's done in __new__
+    # No per-instance __dict__, so each instance costs only the dict storage itself
+    __slots__ = ()
 
     def __repr__(self):
         return dict.__repr__(self)
@@ -72,6 +65,35 @@ class ImmutableDict(dict):
         raise TypeError("Cannot modify an immutable dictionary.")
 
 
+_LOGGER = logging.getLogger(__name__)
+
+_MISSING = object()
+
+
+def _compile_validator(required_attributes):
+    """
+    Builds the validation function of a factory once, so each create_instance
+    call runs a single tight loop over a pre-built tuple of checks.
+
+    Args:
+        required_attributes: Validated (attribute name, type) pairs.
+
+    Returns:
+        function: Takes the keyword arguments of create_instance and returns the first
+        (attribute name, type) pair they don't satisfy, or None if all checks pass.
+    """
+    checks = tuple(required_attributes)
+
+    def first_invalid(kwargs):
+        for attr, attr_type in checks:
+            value = kwargs.get(attr, _MISSING)
+            if value is _MISSING or not isinstance(value, attr_type):
+                return attr, attr_type
+        return None
+
+    return first_invalid
+
+
 class TypedDictFactory:
     """A class that abstracts a dictionary with a specified format."""
 
@@ -84,16 +106,19 @@ class TypedDictFactory:
             required_attributes: An array of tuples, where each tuple contains
             the attribute name (str) and its expected type.
         """
-        self._logger = logging.getLogger(f"{__name__}.{id(self)}")
-        self._logger.propagate = False
-
-        console_handler = logging.StreamHandler()
-        console_handler.setLevel(logging.INFO)
-        console_handler.formatter = logging.Formatter(
-            "%(asctime)s - %(funcName)s - %(levelname)s - %(message)s"
-        )
+        # All factories share one module logger, configured by the first one created
+        self._logger = _LOGGER
+        if not getattr(self._logger, "_ssa_configured", False):
+            self._logger.propagate = False
+
+            console_handler = logging.StreamHandler()
+            console_handler.setLevel(logging.INFO)
+            console_handler.formatter = logging.Formatter(
+                "%(asctime)s - %(funcName)s - %(levelname)s - %(message)s"
+            )
 
-        self._logger.addHandler(console_handler)
+            self._logger.addHandler(console_handler)
+            self._logger._ssa_configured = True
 
         try:
             # Checks if the required attributes follows the pattern Tuple(str, type)
@@ -104,8 +129,10 @@ class TypedDictFactory:
                 and isinstance(attr[1], type)
                 for attr in required_attributes
             ):
-                self._logger.debug("Valid required attributes: %s", required_attributes)
+                if self._logger.isEnabledFor(logging.DEBUG):
+                    self._logger.debug("Valid required attributes: %s", required_attributes)
                 self._required_attributes = required_attributes
+                self._first_invalid = _compile_validator(required_attributes)
 
             else:
                 raise AttributeError
@@ -138,58 +165,32 @@ class TypedDictFactory:
             dict: A dictionary instance with the required attributes if all checks pass, otherwise None.
         """
         try:
-            # For each item in the required attributes, checks if it
-            # was passed in and its type matches the expected type
-            for attr, attr_type in self._required_attributes:
-                self._logger.debug(
-                    "Checking attribute %s with type %s",
-                    attr,
-                    attr_type,
-                )
-
-                if attr not in kwargs:
-                    raise AttributeError(
-                        "Missing required attribute: %s",
-                        attr,
-                    )
-
-                if not isinstance(kwargs[attr], attr_type):
-                    raise TypeError(
-                        "Incorrect type for attribute %s: expected %s, got %s",
-                        attr,
-                        attr_type,
-                        type(kwargs[attr]),
-                    )
-
-            return ImmutableDict({attr: kwargs[attr] for attr in kwargs})
-
+            first_invalid = self._first_invalid
         except AttributeError:
-            # Inner UnboundLocalError is raised if the required attribute is
-            # not a tuple, so it's not possible to be explicit in the error message
-            try:
-                self._logger.error(
-                    "Parameter missing required attributes: (%s, %s)",
-                    attr,
-                    attr_type,
-                )
-            except UnboundLocalError:
-                self._logger.error(
-                    "Error creating the instance: "
-                    "TypedDictFactory doesn't have a valid attributes configuration"
-                )
-
-        except TypeError:
             self._logger.error(
-                "Incorrect type for attribute %s: expected %s, got %s",
+                "Error creating the instance: TypedDictFactory doesn't have a valid attributes configuration"
+            )
+            return None
+
+        invalid = first_invalid(kwargs)
+        if invalid is None:
+            if self._logger.isEnabledFor(logging.DEBUG):
+                self._logger.debug("Creating instance with attributes: %s", list(kwargs))
+            return ImmutableDict(kwargs)
+
+        attr, attr_type = invalid
+        if attr not in kwargs:
+            self._logger.error(
+                "Parameter missing required attributes: (%s, %s)",
                 attr,
                 attr_type,
-                type(kwargs[attr]),
             )
-
-        except Exception as e:
+        else:
             self._logger.error(
-                "Unknown error while creating the instance: %s",
-                e,
+                "Incorrect type for attribute %s: expected %s, got %s",
+                attr,
+                attr_type,
+                type(kwargs[attr]),
             )
 
         return None
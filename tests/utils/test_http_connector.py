@@ -1,10 +1,32 @@
+import socket
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
 from unittest.mock import MagicMock, patch
 
 import pytest
 import requests
 
+from ssa.utils import http_connector
 from ssa.utils.http_connector import HTTPConnector
 
+BASE_URL = "http://api.example.com"
+
+
+@dataclass(slots=True)
+class FakeResponse:
+    """Minimal stand-in for requests.Response with only the attributes the connector reads."""
+
+    status_code: int = 200
+    text: str = "Success"
+    headers: dict[str, str] = field(default_factory=lambda: {"Content-Type": "application/json"})
+    content: bytes = b""
+    error: Exception | None = None
+
+    def raise_for_status(self):
+        if self.error is not None:
+            raise self.error
+
 
 class TestHTTPConnector:
     """Test suite for HTTPConnector class."""
@@ -12,7 +34,7 @@ class TestHTTPConnector:
     @pytest.fixture(autouse=True)
     def setup(self):
         """Set up test fixtures."""
-        self.base_url = "http://api.example.com"
+        self.base_url = BASE_URL
         self.connector = HTTPConnector(
             base_url=self.base_url,
             headers={"X-Custom-Header": "test"},
@@ -21,16 +43,18 @@ class TestHTTPConnector:
             backoff_factor=0.1,
             status_forcelist=[429, 503],
         )
+        yield
+        HTTPConnector.close_all()
+        http_connector._dns_cache.clear()
 
     def _create_mock_response(self, status_code=200, text="Success", headers=None, raise_for_status=None):
-        """Helper method to create a mock response."""
-        mock_response = MagicMock()
-        mock_response.status_code = status_code
-        mock_response.text = text
-        mock_response.headers = headers or {"Content-Type": "application/json"}
-        if raise_for_status:
-            mock_response.raise_for_status.side_effect = raise_for_status
-        return mock_response
+        """Helper method to create a fake response."""
+        return FakeResponse(
+            status_code=status_code,
+            text=text,
+            headers=headers or {"Content-Type": "application/json"},
+            error=raise_for_status,
+        )
 
     def _setup_mock_session(self, mock_session, response):
         """Helper method to set up a mock session with a response."""
@@ -49,8 +73,77 @@ class TestHTTPConnector:
         assert connector.default_headers == {}
         assert connector.retry_strategy.total == 3
         assert connector.retry_strategy.backoff_factor == 0.3
+        assert connector.retry_strategy.respect_retry_after_header
         assert connector.retry_strategy.status_forcelist == [408, 429, 500, 502, 503, 504]
         assert connector.retry_strategy.allowed_methods == ["GET", "POST", "PUT", "PATCH", "DELETE"]
+        assert connector._executor._max_workers == 32
+        assert connector.session.get_adapter(self.base_url)._pool_maxsize == 32
+
+    def test_pooled_connections_keep_alive(self):
+        """Test that pooled connections are opened with TCP keep-alive enabled."""
+        adapter = self.connector.session.get_adapter(self.base_url)
+        socket_options = adapter.poolmanager.connection_pool_kw["socket_options"]
+
+        assert (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1) in socket_options
+
+    def test_https_connectors_share_ssl_context(self):
+        """Test that HTTPS pools of different connectors reuse one preloaded TLS context."""
+        url = "https://api.example.com/"
+        contexts = []
+        for _ in range(2):
+            adapter = HTTPConnector(base_url=url).session.get_adapter(url)
+            request = requests.Request("GET", url).prepare()
+            _, pool_kwargs = adapter.build_connection_pool_key_attributes(request, verify=True)
+            contexts.append(pool_kwargs["ssl_context"])
+
+        assert contexts[0] is not None
+        assert contexts[0] is contexts[1]
+
+    def _dns_cached_connection(self, connector, url):
+        """Helper method to create an unopened connection from a connector's pool for a URL."""
+        pool = connector.session.get_adapter(url).poolmanager.connection_from_url(url)
+        return pool._new_conn()
+
+    def test_dns_cache_hit(self, monkeypatch):
+        """Test that connections of a caching connector resolve their host once per TTL."""
+        lookups = MagicMock(return_value=[(socket.AF_INET, socket.SOCK_STREAM, 6, "", ("10.0.0.1", 80))])
+        connect = MagicMock()
+        # Patched after the connector exists, like gevent/eventlet would, and still used
+        connector = HTTPConnector(base_url=self.base_url, dns_cache_ttl=60)
+        monkeypatch.setattr(socket, "getaddrinfo", lookups)
+        monkeypatch.setattr(http_connector, "create_connection", connect)
+
+        for _ in range(3):
+            assert self._dns_cached_connection(connector, self.base_url)._new_conn() is connect.return_value
+        lookups.assert_called_once_with("api.example.com", 80, socket.AF_UNSPEC, socket.SOCK_STREAM)
+        assert connect.call_args.args == (("10.0.0.1", 80), connect.call_args.args[1])
+
+        # Each connector applies its own TTL to the cached entry
+        short_lived = HTTPConnector(base_url=self.base_url, dns_cache_ttl=1e-9)
+        self._dns_cached_connection(short_lived, self.base_url)._new_conn()
+        assert lookups.call_count == 2
+
+    def test_dns_cache_disabled(self):
+        """Test that connectors without a DNS TTL keep urllib3's default connections."""
+        connection = self._dns_cached_connection(self.connector, self.base_url)
+
+        assert type(connection) is http_connector.HTTPConnection
+
+    def test_dns_cache_forgets_unreachable_addresses(self, monkeypatch):
+        """Test that a failed connect drops the cached addresses so the host is resolved again."""
+        lookups = MagicMock(return_value=[(socket.AF_INET, socket.SOCK_STREAM, 6, "", ("10.0.0.1", 443))])
+        monkeypatch.setattr(socket, "getaddrinfo", lookups)
+        monkeypatch.setattr(http_connector, "create_connection", MagicMock(side_effect=OSError("refused")))
+        url = "https://api.example.com"
+        connection = self._dns_cached_connection(HTTPConnector(base_url=url, dns_cache_ttl=60), url)
+
+        with pytest.raises(http_connector.NewConnectionError, match="refused"):
+            connection._new_conn()
+        assert not http_connector._dns_cache
+
+        with pytest.raises(http_connector.NewConnectionError):
+            connection._new_conn()
+        assert lookups.call_count == 2
 
     def test_init_with_custom_values(self):
         """Test HTTPConnector initialization with custom values."""
@@ -68,20 +161,23 @@ class TestHTTPConnector:
         assert connector.default_headers == {"Custom-Header": "value"}
         assert connector.retry_strategy.total == 5
         assert connector.retry_strategy.backoff_factor == 0.5
+        assert connector.retry_strategy.backoff_jitter == 0.25
         assert connector.retry_strategy.status_forcelist == [500, 503]
         assert connector.retry_strategy.allowed_methods == ["GET", "POST", "PUT", "PATCH", "DELETE"]
 
-    def test_get_headers(self):
-        """Test header generation with different configurations."""
-        test_cases = [
-            # (connector_config, additional_headers, expected_headers)
+    @pytest.mark.parametrize(
+        ("config", "additional_headers", "expected_headers"),
+        [
             (
-                {"base_url": self.base_url},
+                {"base_url": BASE_URL},
                 None,
-                {"Content-Type": "application/json", "Accept": "application/json"},
+                {
+                    "Content-Type": "application/json",
+                    "Accept": "application/json",
+                },
             ),
             (
-                {"base_url": self.base_url, "auth_token": "test-token"},
+                {"base_url": BASE_URL, "auth_token": "test-token"},
                 None,
                 {
                     "Content-Type": "application/json",
@@ -90,7 +186,7 @@ class TestHTTPConnector:
                 },
             ),
             (
-                {"base_url": self.base_url, "headers": {"X-Custom-Header": "default-value"}},
+                {"base_url": BASE_URL, "headers": {"X-Custom-Header": "default-value"}},
                 None,
                 {
                     "Content-Type": "application/json",
@@ -99,7 +195,7 @@ class TestHTTPConnector:
                 },
             ),
             (
-                {"base_url": self.base_url},
+                {"base_url": BASE_URL},
                 {"X-Additional-Header": "additional-value"},
                 {
                     "Content-Type": "application/json",
@@ -108,7 +204,7 @@ class TestHTTPConnector:
                 },
             ),
             (
-                {"base_url": self.base_url, "headers": {"X-Custom-Header": "default-value"}},
+                {"base_url": BASE_URL, "headers": {"X-Custom-Header": "default-value"}},
                 {"X-Custom-Header": "override-value"},
                 {
                     "Content-Type": "application/json",
@@ -116,12 +212,29 @@ class TestHTTPConnector:
                     "X-Custom-Header": "override-value",
                 },
             ),
-        ]
+        ],
+    )
+    def test_get_headers(self, config, additional_headers, expected_headers):
+        """Test header generation with different configurations."""
+        connector = HTTPConnector(**config)
+        assert connector._get_headers(additional_headers) == expected_headers
+
+    def test_get_headers_reuses_base_headers(self):
+        """Test that default headers are built once and the auth token is not overridden."""
+        assert self.connector._get_headers() is self.connector._get_headers()
+
+        headers = self.connector._get_headers({"Authorization": "Basic other"})
+        assert headers["Authorization"] == "Bearer test-token"
 
-        for config, additional_headers, expected_headers in test_cases:
-            connector = HTTPConnector(**config)
-            headers = connector._get_headers(additional_headers)
-            assert headers == expected_headers
+    def test_get_headers_caches_merged_headers(self):
+        """Test that repeated additional headers reuse the same merged dictionary."""
+        first = self.connector._get_headers({"X-Additional-Header": "value"})
+        second = self.connector._get_headers({"X-Additional-Header": "value"})
+        other = self.connector._get_headers({"X-Additional-Header": "other"})
+
+        assert first is second
+        assert other["X-Additional-Header"] == "other"
+        assert first["X-Custom-Header"] == "test"
 
     @patch("requests.Session")
     def test_request_non_retryable_error(self, mock_session):
@@ -138,6 +251,21 @@ class TestHTTPConnector:
 
         mock_session_instance.request.assert_called_once()
 
+    @patch("requests.Session")
+    def test_request_retryable_status_warns(self, mock_session):
+        """Test that retryable statuses reaching the connector are logged and returned, not raised."""
+        mock_response = self._create_mock_response(
+            status_code=503,
+            raise_for_status=requests.exceptions.HTTPError("503 Service Unavailable"),
+        )
+        self._setup_mock_session(mock_session, mock_response)
+
+        with patch.object(self.connector.logger, "warning") as mock_warning:
+            assert self.connector.request("HEAD", "test") is mock_response
+
+        mock_warning.assert_called_once()
+        assert self.connector._retry_statuses == frozenset({429, 503})
+
     @patch("requests.Session")
     def test_request_success(self, mock_session):
         """Test successful request."""
@@ -166,6 +294,57 @@ class TestHTTPConnector:
             data=None,
         )
 
+    @patch("requests.Session.request")
+    def test_request_url_leading_slash(self, mock_request):
+        """Test that leading slashes in the endpoint don't duplicate the separator"""
+        mock_request.return_value = self._create_mock_response()
+
+        self.connector.request("GET", "//test-endpoint")
+
+        assert mock_request.call_args.kwargs["url"] == f"{self.base_url}/test-endpoint"
+
+    @patch("requests.Session.request")
+    def test_get_request_not_modified(self, mock_request):
+        """Test that a 304 answer to a conditional GET returns the cached response"""
+        cached_response = self._create_mock_response(headers={"ETag": '"v1"'})
+        mock_request.side_effect = [cached_response, self._create_mock_response(status_code=304)]
+
+        first = self.connector.get("test-endpoint", params={"key": "value"})
+        second = self.connector.get("test-endpoint", params={"key": "value"})
+
+        assert first is cached_response
+        assert second is cached_response
+        assert mock_request.call_args.kwargs["headers"]["If-None-Match"] == '"v1"'
+        assert "If-None-Match" not in self.connector._get_headers()
+
+    @patch("requests.Session.request")
+    def test_get_request_cache_keyed_on_headers(self, mock_request):
+        """Test that cached responses are only revalidated for requests with the same headers"""
+        json_response = self._create_mock_response(headers={"ETag": '"json"'})
+        csv_response = self._create_mock_response(headers={"ETag": '"csv"'})
+        mock_request.side_effect = [json_response, csv_response, self._create_mock_response(status_code=304)]
+
+        self.connector.get("test-endpoint")
+        assert self.connector.get("test-endpoint", headers={"Accept": "text/csv"}) is csv_response
+        assert "If-None-Match" not in mock_request.call_args.kwargs["headers"]
+
+        assert self.connector.get("test-endpoint", headers={"Accept": "text/csv"}) is csv_response
+        assert mock_request.call_args.kwargs["headers"]["If-None-Match"] == '"csv"'
+        # Validators aren't memoized with the merged headers
+        assert self.connector._merge_headers.cache_info().currsize == 1
+
+    @patch("requests.Session.request")
+    def test_get_request_no_store(self, mock_request):
+        """Test that responses marked no-store are not revalidated"""
+        mock_request.return_value = self._create_mock_response(
+            headers={"ETag": '"v1"', "Cache-Control": "no-store"}
+        )
+
+        self.connector.get("test-endpoint")
+        self.connector.get("test-endpoint")
+
+        assert "If-None-Match" not in mock_request.call_args.kwargs["headers"]
+
     @patch("requests.Session.request")
     def test_post_request(self, mock_request):
         """Test POST request"""
@@ -180,7 +359,7 @@ class TestHTTPConnector:
             url=f"{self.connector.base_url}/test-endpoint",
             headers=self.connector._get_headers(),
             params=None,
-            data=data,
+            data=b'{"key":"value"}',
         )
 
     @patch("requests.Session.request")
@@ -197,7 +376,7 @@ class TestHTTPConnector:
             url=f"{self.connector.base_url}/test-endpoint",
             headers=self.connector._get_headers(),
             params=None,
-            data=data,
+            data=b'{"key":"value"}',
         )
 
     @patch("requests.Session.request")
@@ -214,7 +393,7 @@ class TestHTTPConnector:
             url=f"{self.connector.base_url}/test-endpoint",
             headers=self.connector._get_headers(),
             params=None,
-            data=data,
+            data=b'{"key":"value"}',
         )
 
     @patch("requests.Session.request")
@@ -246,6 +425,48 @@ class TestHTTPConnector:
         assert all(r.status_code == 200 for r in responses)
         assert mock_request.call_count == 3
 
+    @patch("requests.Session.request")
+    def test_parallel_requests_keep_order(self, mock_request):
+        """Test that parallel responses are returned in the order of the endpoints"""
+        mock_request.side_effect = lambda **kwargs: self._create_mock_response(text=kwargs["url"])
+
+        endpoints = [f"endpoint{i}" for i in range(10)]
+        responses = self.connector.get_multiple(endpoints)
+
+        assert [r.text for r in responses] == [f"{self.base_url}/{e}" for e in endpoints]
+
+    @patch("requests.Session.request")
+    def test_coalesces_duplicate_get(self, mock_request, monkeypatch):
+        """Test that identical GETs in flight at the same time share one request"""
+        started, release = threading.Event(), threading.Event()
+        joined = threading.Semaphore(0)
+
+        class TrackedFuture(Future):
+            def result(self, timeout=None):
+                joined.release()
+                return super().result(timeout)
+
+        def blocked_request(**kwargs):
+            started.set()
+            assert release.wait(timeout=5)
+            return self._create_mock_response()
+
+        monkeypatch.setattr(http_connector, "Future", TrackedFuture)
+        mock_request.side_effect = blocked_request
+
+        with ThreadPoolExecutor(max_workers=1) as caller:
+            pending = caller.submit(self.connector.get_multiple, ["e", "e", "e"])
+            # Keep the first request in flight until both duplicates wait on it
+            assert started.wait(timeout=5)
+            assert joined.acquire(timeout=5)
+            assert joined.acquire(timeout=5)
+            release.set()
+            responses = pending.result(timeout=5)
+
+        assert mock_request.call_count == 1
+        assert responses[0] is responses[1] is responses[2]
+        assert self.connector._inflight == {}
+
     @patch("requests.Session.request")
     def test_post_multiple(self, mock_request):
         """Test multiple POST requests"""
@@ -259,6 +480,8 @@ class TestHTTPConnector:
         assert len(responses) == 2
         assert all(r.status_code == 201 for r in responses)
         assert mock_request.call_count == 2
+        sent = sorted(c.kwargs["data"] for c in mock_request.call_args_list)
+        assert sent == [b'{"key1":"value1"}', b'{"key2":"value2"}']
 
     @patch("requests.Session.request")
     def test_put_multiple(self, mock_request):
@@ -318,8 +541,109 @@ class TestHTTPConnector:
         assert len(responses) == 2
         assert all(r.status_code == 200 for r in responses)
         assert mock_request.call_count == 2
+        sent = {c.kwargs["url"]: c.kwargs for c in mock_request.call_args_list}
+        assert sent[f"{self.base_url}/endpoint1"]["params"] == {"param1": "value1"}
+        assert sent[f"{self.base_url}/endpoint2"]["headers"]["Header2"] == "value2"
+
+    @patch("requests.Session.send")
+    def test_prepared_call(self, mock_send):
+        """Test that a prepared call reuses its template for every send"""
+        mock_send.return_value = self._create_mock_response()
+        call = self.connector.prepare("POST", "/test-endpoint")
+
+        call.send(params={"page": 1}, data={"key": "value"})
+        call.send(params={"page": 2})
+
+        first, second = (c.args[0] for c in mock_send.call_args_list)
+        assert first.url == f"{self.base_url}/test-endpoint?page=1"
+        assert first.body == b'{"key":"value"}'
+        assert first.headers["Authorization"] == "Bearer test-token"
+        assert second.url == f"{self.base_url}/test-endpoint?page=2"
+        assert second.body is None
+
+    @patch("requests.Session.send")
+    def test_prepared_call_non_retryable_error(self, mock_send):
+        """Test that prepared calls raise on non-retryable errors"""
+        mock_send.return_value = self._create_mock_response(
+            status_code=404,
+            raise_for_status=requests.exceptions.HTTPError("404 Not Found"),
+        )
+
+        with pytest.raises(requests.exceptions.HTTPError):
+            self.connector.prepare("GET", "missing").send()
+
+    @patch("requests.Session.send")
+    def test_prepared_call_no_debug_records(self, mock_send):
+        """Test that prepared calls don't emit debug records unless debug logging is enabled"""
+        mock_send.return_value = self._create_mock_response()
+        call = self.connector.prepare("GET", "test-endpoint")
+
+        with patch.object(self.connector.logger, "debug") as mock_debug:
+            call.send()
+
+        mock_debug.assert_not_called()
+
+    def test_dumps(self):
+        """Test that payloads are written as compact UTF-8 JSON and NaN is rejected"""
+        assert http_connector._dumps({"team": "São Paulo", "odds": [1.5]}) == (
+            '{"team":"São Paulo","odds":[1.5]}'.encode()
+        )
+        with pytest.raises(ValueError):
+            http_connector._dumps({"odds": float("nan")})
+        assert http_connector._dumps({1: "a"}) == b'{"1":"a"}'
+
+    def test_json(self):
+        """Test decoding a JSON response body"""
+        response = self._create_mock_response()
+        response.content = b'{"key": [1, 2]}'
+
+        assert self.connector.json(response) == {"key": [1, 2]}
 
     def test_close(self):
         """Test session close"""
         self.connector.close()
         assert self.connector.session.close
+        with pytest.raises(RuntimeError):
+            self.connector._executor.submit(print)
+
+    def test_connectors_share_connection_pool(self):
+        """Test that connectors with the same settings share a pool until the last one closes"""
+        first = HTTPConnector(base_url=self.base_url)
+        second = HTTPConnector(base_url=f"{self.base_url}/v2")
+        other = HTTPConnector(base_url=self.base_url, max_workers=4)
+
+        adapter = first.session.get_adapter(self.base_url)
+        assert first.session is not second.session
+        assert second.session.get_adapter(self.base_url) is adapter
+        assert other.session.get_adapter(self.base_url) is not adapter
+
+        with patch.object(adapter, "close") as mock_close:
+            first.close()
+            first.close()
+            mock_close.assert_not_called()
+            assert second.session.get_adapter(self.base_url) is adapter
+            second.close()
+            mock_close.assert_called()
+
+    def test_connectors_keep_separate_cookies(self):
+        """Test that connectors sharing a pool don't share cookies or session state"""
+        tenant_a = HTTPConnector(base_url=self.base_url, auth_token="token-a")
+        tenant_b = HTTPConnector(base_url=self.base_url, auth_token="token-b")
+
+        assert tenant_a.session.get_adapter(self.base_url) is tenant_b.session.get_adapter(self.base_url)
+        tenant_a.session.cookies.set("sessionid", "tenant-a", domain="api.example.com")
+        tenant_a.session.headers["X-Tenant"] = "a"
+
+        assert "sessionid" not in tenant_b.session.cookies
+        assert "X-Tenant" not in tenant_b.session.headers
+        prepared = tenant_b.session.prepare_request(requests.Request("GET", f"{self.base_url}/test"))
+        assert "Cookie" not in prepared.headers
+
+    def test_context_manager(self):
+        """Test that leaving the context closes the connector"""
+        with HTTPConnector(base_url=self.base_url) as connector:
+            connector.session = MagicMock()
+
+        connector.session.close.assert_called_once()
+        with pytest.raises(RuntimeError):
+            connector._executor.submit(print)
@@ -1,6 +1,7 @@
 import logging
 import unittest
 from io import StringIO
+from unittest.mock import patch
 
 from ssa.utils.logger import Logger
 
@@ -8,6 +9,7 @@ from ssa.utils.logger import Logger
 class TestLogger(unittest.TestCase):
     def setUp(self):
         """Set up test fixtures before each test method."""
+        Logger.reset()
         self.log_output = StringIO()
         self.handler = logging.StreamHandler(self.log_output)
         self.handler.setLevel(logging.DEBUG)
@@ -20,6 +22,16 @@ class TestLogger(unittest.TestCase):
         self.assertEqual(len(logger.handlers), 1)
         self.assertIsInstance(logger.handlers[0], logging.StreamHandler)
 
+    def test_repeated_calls_reuse_handlers(self):
+        """Test that requesting the same logger again doesn't replace its handlers."""
+        first = Logger.get_logger()
+        handler = first.handlers[0]
+        second = Logger.get_logger(log_level=logging.DEBUG)
+
+        self.assertIs(first, second)
+        self.assertEqual(second.handlers, [handler])
+        self.assertEqual(second.level, logging.DEBUG)
+
     def test_custom_log_level(self):
         """Test creating a logger with a custom log level."""
         logger = Logger.get_logger(log_level=logging.CRITICAL)
@@ -40,6 +52,15 @@ class TestLogger(unittest.TestCase):
         self.assertEqual(len(logger.handlers), 2)
         self.assertIn(self.handler, logger.handlers)
 
+    def test_custom_handler_added_once(self):
+        """Test that a handler writing to an already used stream isn't added again."""
+        Logger._create_logger(level=logging.INFO, custom_handler=self.handler)
+        duplicate = logging.StreamHandler(self.log_output)
+        logger = Logger._create_logger(level=logging.INFO, custom_handler=duplicate)
+
+        self.assertEqual(len(logger.handlers), 2)
+        self.assertNotIn(duplicate, logger.handlers)
+
     def test_logging_output(self):
         """Test actual logging output format."""
         # Create a logger with our test handler
@@ -53,6 +74,20 @@ class TestLogger(unittest.TestCase):
         self.assertIn("level=INFO", output)
         self.assertIn("Logger", output)
 
+    def test_records_keep_thread_and_process_info(self):
+        """Test that importing the logger doesn't change what records collect."""
+        record = Logger.get_logger().makeRecord("Logger", logging.INFO, __file__, 1, "message", None, None)
+        self.assertIsNotNone(record.thread)
+        self.assertIsNotNone(record.process)
+
+    @patch.multiple(logging, logThreads=True, logProcesses=True, logMultiprocessing=True)
+    def test_skip_thread_and_process_info(self):
+        """Test the explicit opt-out of thread and process fields."""
+        Logger.skip_thread_and_process_info()
+        record = Logger.get_logger().makeRecord("Logger", logging.INFO, __file__, 1, "message", None, None)
+        self.assertIsNone(record.thread)
+        self.assertIsNone(record.process)
+
     def test_logger_propagation(self):
         """Test that logger propagation is disabled."""
         logger = Logger.get_logger()
@@ -1,20 +1,42 @@
+import os
+import pickle
 import sys
+from collections import namedtuple
+from contextlib import nullcontext
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
 import pytest
 
+
+class MlflowException(Exception):
+    """Stand-in for mlflow.exceptions.MlflowException, which must be a real exception class."""
+
+    def __init__(self, message, error_code="INTERNAL_ERROR"):
+        super().__init__(message)
+        self.error_code = error_code
+
+
 # Mocking MLFlow modules before importing
 mock_mlflow = MagicMock()
 mock_mlflow.tracking.MlflowClient = MagicMock
 mock_mlflow.pyfunc.PyFuncModel = MagicMock
+mock_mlflow.entities.Metric = namedtuple("Metric", ["key", "value", "timestamp", "step"])
+mock_mlflow.entities.Param = namedtuple("Param", ["key", "value"])
+mock_mlflow.entities.RunTag = namedtuple("RunTag", ["key", "value"])
 sys.modules["mlflow"] = mock_mlflow
 sys.modules["mlflow.tracking"] = mock_mlflow.tracking
+sys.modules["mlflow.tracking.context"] = mock_mlflow.tracking.context
+sys.modules["mlflow.tracking.context.registry"] = mock_mlflow.tracking.context.registry
 sys.modules["mlflow.sklearn"] = mock_mlflow.sklearn
 sys.modules["mlflow.pytorch"] = mock_mlflow.pytorch
 sys.modules["mlflow.tensorflow"] = mock_mlflow.tensorflow
 sys.modules["mlflow.pyfunc"] = mock_mlflow.pyfunc
+sys.modules["mlflow.entities"] = mock_mlflow.entities
+mock_mlflow.exceptions.MlflowException = MlflowException
+sys.modules["mlflow.exceptions"] = mock_mlflow.exceptions
 
-from ssa.utils.mlflow_model_manager import MLflowModelManager  # noqa: E402
+from ssa.utils.mlflow_model_manager import MLflowModelManager, _resolve_experiment_id  # noqa: E402
 
 
 class TestMLflowModelManager:
@@ -29,29 +51,39 @@ class TestMLflowModelManager:
             patch("ssa.utils.mlflow_model_manager.MlflowClient") as mock_client_class,
             patch("mlflow.set_tracking_uri") as mock_uri,
             patch("mlflow.set_experiment") as mock_exp,
-            patch("mlflow.create_experiment", return_value="exp_id_123"),
-            patch("mlflow.get_experiment_by_name") as mock_get_exp,
+            patch("mlflow.create_experiment", return_value="exp_id_123") as mock_create_exp,
+            patch("mlflow.get_experiment_by_name", return_value=None) as mock_get_exp,
             patch("mlflow.start_run") as mock_run,
             patch("mlflow.register_model") as mock_reg,
+            patch(
+                "ssa.utils.mlflow_model_manager.resolve_tags",
+                return_value={"mlflow.user": "alice", "mlflow.source.type": "LOCAL"},
+            ) as mock_resolve_tags,
         ):
+            _resolve_experiment_id.cache_clear()
+            MLflowModelManager._clients.clear()
+
             # Setup Logger mock
             mock_log_class.get_logger.return_value = MagicMock()
 
             # Setup MlflowClient mock instance
             mock_client_instance = mock_client_class.return_value
+            run = SimpleNamespace(info=SimpleNamespace(run_id="test_run_id"))
+            mock_client_instance.create_run.return_value = run
 
             # Setup start_run context manager (returns a run object with an info.run_id)
-            mock_run_context = MagicMock()
-            mock_run_context.info.run_id = "test_run_id"
-            mock_run.return_value.__enter__.return_value = mock_run_context
+            mock_run.return_value = nullcontext(run)
 
             yield {
                 "uri": mock_uri,
                 "exp": mock_exp,
+                "create_exp": mock_create_exp,
                 "get_exp": mock_get_exp,
                 "run": mock_run,
                 "reg": mock_reg,
                 "client": mock_client_instance,
+                "client_class": mock_client_class,
+                "resolve_tags": mock_resolve_tags,
             }
 
     @pytest.fixture
@@ -66,28 +98,235 @@ class TestMLflowModelManager:
         assert manager.experiment_id == "exp_id_123"
         mock_mlflow["exp"].assert_called_with("test_experiment")
 
+    def test_init_no_instance_dict(self, manager):
+        """Verify managers keep their state in slots rather than a per-instance dict."""
+        assert not hasattr(manager, "__dict__")
+
+    def test_init_existing_experiment(self, mock_mlflow):
+        """Verify an existing experiment is reused and looked up only once."""
+        mock_mlflow["get_exp"].return_value = MagicMock(experiment_id="exp_id_456")
+
+        first = MLflowModelManager("model_a", experiment_name="existing")
+        second = MLflowModelManager("model_b", experiment_name="existing")
+
+        assert first.experiment_id == second.experiment_id == "exp_id_456"
+        mock_mlflow["get_exp"].assert_called_once_with("existing")
+        mock_mlflow["create_exp"].assert_not_called()
+
+    def test_init_experiment_created_concurrently(self, mock_mlflow):
+        """Verify a create race falls back to the experiment created elsewhere."""
+        mock_mlflow["get_exp"].side_effect = [None, MagicMock(experiment_id="exp_id_789")]
+        mock_mlflow["create_exp"].side_effect = MlflowException(
+            "exists", error_code="RESOURCE_ALREADY_EXISTS"
+        )
+
+        manager = MLflowModelManager("model_a", experiment_name="racing")
+
+        assert manager.experiment_id == "exp_id_789"
+
+    def test_init_experiment_create_error(self, mock_mlflow):
+        """Verify unrelated create failures are not swallowed."""
+        mock_mlflow["create_exp"].side_effect = MlflowException("denied", error_code="PERMISSION_DENIED")
+
+        with pytest.raises(MlflowException, match="denied"):
+            MLflowModelManager("model_a", experiment_name="forbidden")
+
+    def test_init_shares_client(self, mock_mlflow):
+        """Verify managers for the same tracking server share one client."""
+        first = MLflowModelManager("model_a", tracking_uri="http://mlflow:5000")
+        second = MLflowModelManager("model_b", tracking_uri="http://mlflow:5000")
+
+        assert first.client is second.client
+        mock_mlflow["client_class"].assert_called_once_with(tracking_uri="http://mlflow:5000")
+
+    def test_close_all(self, mock_mlflow):
+        """Verify shared clients are dropped and their store engines disposed."""
+        manager = MLflowModelManager("model_a", tracking_uri="http://mlflow:5000")
+        engine = manager.client._tracking_client.store.engine
+        registry_engine = manager.client._registry_client_lazy.store.engine
+
+        MLflowModelManager.close_all()
+
+        engine.dispose.assert_called_once()
+        registry_engine.dispose.assert_called_once()
+        assert MLflowModelManager._clients == {}
+
+    def test_close_all_store_variants(self, mock_mlflow):
+        """Verify a shared engine is disposed once and stores without one are skipped."""
+        engine = MagicMock()
+        shared = SimpleNamespace(
+            _tracking_client=SimpleNamespace(store=SimpleNamespace(engine=engine)),
+            _registry_client_lazy=SimpleNamespace(store=SimpleNamespace(engine=engine)),
+        )
+        rest = SimpleNamespace(_tracking_client=SimpleNamespace(store=SimpleNamespace()))
+        MLflowModelManager._clients.update({"sqlite:///mlflow.db": shared, "http://mlflow:5000": rest})
+
+        MLflowModelManager.close_all()
+
+        engine.dispose.assert_called_once()
+        assert MLflowModelManager._clients == {}
+
     def test_init_registry_only_mode(self, mock_mlflow):
         """Verify initialization without tracking/experiments."""
         manager = MLflowModelManager("model_a")
         assert manager.experiment_id is None
         mock_mlflow["exp"].assert_not_called()
 
+    def test_init_http_pool_size(self, mock_mlflow):
+        """Verify pool and retry settings are exported for MLflow's shared HTTP session."""
+        with patch.dict("os.environ", {}, clear=True) as environ:
+            MLflowModelManager("model_a", http_pool_size=32, http_max_retries=5)
+
+            assert environ["MLFLOW_HTTP_POOL_CONNECTIONS"] == "32"
+            assert environ["MLFLOW_HTTP_POOL_MAXSIZE"] == "32"
+            assert environ["MLFLOW_HTTP_REQUEST_MAX_RETRIES"] == "5"
+
+    def test_init_http_pool_size_first_wins(self, mock_mlflow):
+        """Verify a conflicting pool size keeps the process-wide value and logs a warning."""
+        with patch.dict("os.environ", {"MLFLOW_HTTP_POOL_CONNECTIONS": "8"}, clear=True) as environ:
+            manager = MLflowModelManager("model_a", http_pool_size=32)
+
+            assert environ["MLFLOW_HTTP_POOL_CONNECTIONS"] == "8"
+            assert environ["MLFLOW_HTTP_POOL_MAXSIZE"] == "32"
+            manager.logger.warning.assert_called_once()
+            assert "MLFLOW_HTTP_POOL_CONNECTIONS" in manager.logger.warning.call_args.args
+
     # --- Logging Tests ---
 
     @patch("mlflow.sklearn.log_model")
-    @patch("mlflow.log_params")
-    @patch("mlflow.log_metrics")
-    def test_log_model_sklearn(self, mock_metrics, mock_params, mock_sklearn, manager):
+    def test_log_model_sklearn(self, mock_sklearn, manager, mock_mlflow):
         """Verify that logging calls the correct MLflow sub-modules."""
         params = {"alpha": 0.1}
         metrics = {"rmse": 0.5}
 
-        run_id = manager.log_model(model=MagicMock(), params=params, metrics=metrics, model_type="sklearn")
+        run_id = manager.log_model(
+            model=MagicMock(), params=params, metrics=metrics, model_type="sklearn", tags={"team": "a"}
+        )
 
         assert run_id == "test_run_id"
-        mock_params.assert_called_once_with(params)
-        mock_metrics.assert_called_once_with(metrics)
+        mock_mlflow["client"].log_batch.assert_called_once()
+        call = mock_mlflow["client"].log_batch.call_args
+        assert call.args == ("test_run_id",)
+        assert [(p.key, p.value) for p in call.kwargs["params"]] == [("alpha", "0.1")]
+        assert [(m.key, m.value) for m in call.kwargs["metrics"]] == [("rmse", 0.5)]
+        assert [(t.key, t.value) for t in call.kwargs["tags"]] == [("team", "a")]
+        assert call.kwargs["synchronous"] is False
+        mock_mlflow["client"].log_batch.return_value.wait.assert_called_once()
         mock_sklearn.assert_called_once()
+        mock_mlflow["run"].assert_called_once_with(run_id="test_run_id")
+        mock_mlflow["client"].set_terminated.assert_called_once_with("test_run_id")
+
+    @patch("mlflow.sklearn.log_model")
+    def test_log_model_context_tags(self, mock_sklearn, manager, mock_mlflow):
+        """Verify runs get the user/source tags mlflow.start_run would have set."""
+        manager.log_model(model=MagicMock(), params={}, metrics={}, run_name="nightly")
+
+        mock_mlflow["resolve_tags"].assert_called_once_with()
+        mock_mlflow["client"].create_run.assert_called_once_with(
+            "exp_id_123",
+            tags={"mlflow.user": "alice", "mlflow.source.type": "LOCAL"},
+            run_name="nightly",
+        )
+
+    @pytest.mark.parametrize(
+        ("model_type", "positional", "model_kwarg", "code_kwarg"),
+        [
+            ("tensorflow", True, None, None),
+            ("pytorch", True, None, "code_paths"),
+            ("pyfunc", False, "python_model", "code_path"),
+        ],
+    )
+    def test_log_model_flavor_arguments(self, manager, model_type, positional, model_kwarg, code_kwarg):
+        """Verify each flavor receives the model and code paths under its own argument names."""
+        model = MagicMock()
+
+        with patch(f"mlflow.{model_type}.log_model") as mock_log:
+            manager.log_model(model=model, params={}, metrics={}, model_type=model_type, code_paths=["a.py"])
+
+        call = mock_log.call_args
+        assert call.args == ((model,) if positional else ())
+        assert call.kwargs["name"] == "model"
+        if model_kwarg:
+            assert call.kwargs[model_kwarg] is model
+        if code_kwarg:
+            assert call.kwargs[code_kwarg] == ["a.py"]
+        assert {"code_paths", "code_path"} & set(call.kwargs) == ({code_kwarg} if code_kwarg else set())
+
+    def test_log_model_unsupported_type_fails_run(self, manager, mock_mlflow):
+        """Verify the run is marked as failed when logging raises."""
+        with pytest.raises(ValueError, match="Unsupported model_type"):
+            manager.log_model(model=MagicMock(), params={}, metrics={}, model_type="xgboost")
+
+        mock_mlflow["client"].set_terminated.assert_called_once_with("test_run_id", status="FAILED")
+
+    @patch("mlflow.sklearn.log_model")
+    def test_log_model_single_batch(self, mock_sklearn, manager, mock_mlflow):
+        """Verify all scalars go out in one log_batch call, leaving chunking to MLflow."""
+        params = {f"p{i}": i for i in range(250)}
+        metrics = {f"m{i}": float(i) for i in range(250)}
+
+        manager.log_model(model=MagicMock(), params=params, metrics=metrics)
+
+        mock_mlflow["client"].log_batch.assert_called_once()
+        call = mock_mlflow["client"].log_batch.call_args
+        assert len(call.kwargs["params"]) == 250
+        assert len(call.kwargs["metrics"]) == 250
+        assert len({m.timestamp for m in call.kwargs["metrics"]}) == 1
+
+    @patch("mlflow.flush_async_logging")
+    @patch("mlflow.sklearn.log_model")
+    def test_log_model_async(self, mock_sklearn, mock_flush, manager, mock_mlflow):
+        """Verify async logging returns without waiting and is flushed through this manager's batches."""
+        pending = mock_mlflow["client"].log_batch.return_value
+        manager.log_model(model=MagicMock(), params={"alpha": 0.1}, metrics={}, async_log=True)
+
+        pending.wait.assert_not_called()
+
+        manager.flush_logging()
+        pending.wait.assert_called_once()
+        mock_flush.assert_not_called()
+
+        # Flushed batches aren't waited on again
+        manager.flush_logging()
+        pending.wait.assert_called_once()
+
+    @patch("mlflow.sklearn.log_model")
+    def test_log_model_without_scalars(self, mock_sklearn, manager, mock_mlflow):
+        """Verify no batch request is sent when there is nothing to log."""
+        manager.log_model(model=MagicMock(), params={}, metrics={})
+
+        mock_mlflow["client"].log_batch.assert_not_called()
+
+    @patch("mlflow.sklearn.log_model")
+    def test_log_model_artifacts(self, mock_sklearn, manager, mock_mlflow):
+        """Verify every artifact is uploaded to the run under its name."""
+        artifacts = {"plots": "out/plots.png", "report": "out/report.html"}
+
+        manager.log_model(model=MagicMock(), params={}, metrics={}, artifacts=artifacts)
+
+        calls = mock_mlflow["client"].log_artifact.call_args_list
+        assert sorted((c.args, c.kwargs["artifact_path"]) for c in calls) == [
+            (("test_run_id", "out/plots.png"), "plots"),
+            (("test_run_id", "out/report.html"), "report"),
+        ]
+
+    def test_log_model_custom(self, manager, mock_mlflow):
+        """Verify custom models are pickled and uploaded under the model artifact path."""
+        uploaded = {}
+
+        def capture(run_id, local_path, artifact_path=None):
+            assert os.path.basename(local_path) == "model.pkl"
+            with open(local_path, "rb") as f:
+                uploaded[artifact_path] = pickle.load(f)  # noqa: S301
+
+        mock_mlflow["client"].log_artifact.side_effect = capture
+
+        manager.log_model(
+            model={"weights": [1, 2, 3], "scale": lambda x: x * 2}, params={}, metrics={}, model_type="custom"
+        )
+
+        assert uploaded["model"]["weights"] == [1, 2, 3]
+        assert uploaded["model"]["scale"](21) == 42
 
     def test_log_model_no_experiment_raises_error(self, mock_mlflow):
         """Ensure logic prevents logging when no experiment is set."""
@@ -109,12 +348,264 @@ class TestMLflowModelManager:
         # Verify call to the mocked MlflowClient
         mock_mlflow["client"].set_registered_model_alias.assert_called()
 
-    def test_load_model_by_alias(self, manager):
-        """Verify URI formatting for alias-based loading."""
+    def test_register_model_description_and_alias(self, manager, mock_mlflow):
+        """Verify the description and alias are both applied to the new version."""
+        mock_mlflow["reg"].return_value.version = "2"
+
+        manager.register_model(run_id="run_123", alias="prod", description="Better model")
+
+        mock_mlflow["client"].update_model_version.assert_called_once_with(
+            name="test_model", version="2", description="Better model"
+        )
+        mock_mlflow["client"].set_registered_model_alias.assert_called_once_with(
+            name="test_model", alias="prod", version="2"
+        )
+
+    def test_register_model_tags(self, manager, mock_mlflow):
+        """Verify tags are sent with the registration request."""
+        mock_mlflow["reg"].return_value.version = "3"
+
+        manager.register_model(run_id="run_123", tags={"a": "1", "b": "2"})
+
+        mock_mlflow["reg"].assert_called_once_with(
+            "runs:/run_123/model", "test_model", tags={"a": "1", "b": "2"}
+        )
+        mock_mlflow["client"].set_model_version_tag.assert_not_called()
+
+    def test_load_model_by_alias(self, manager, mock_mlflow):
+        """Verify aliases are resolved to their version before loading."""
+        mock_mlflow["client"].get_model_version_by_alias.return_value = MagicMock(version="7")
+
+        with patch("mlflow.pyfunc.load_model") as mock_load:
+            manager.load_model(alias="production")
+            mock_load.assert_called_with("models:/test_model/7")
+
+    def test_load_model_by_unknown_alias(self, manager, mock_mlflow):
+        """Verify the alias URI is used when the alias can't be resolved."""
+        mock_mlflow["client"].get_model_version_by_alias.side_effect = MlflowException(
+            "not found", error_code="RESOURCE_DOES_NOT_EXIST"
+        )
+
         with patch("mlflow.pyfunc.load_model") as mock_load:
             manager.load_model(alias="production")
             mock_load.assert_called_with("models:/test_model@production")
 
+    def test_load_model_by_version(self, manager):
+        """Verify URI formatting for version-based loading."""
+        with patch("mlflow.pyfunc.load_model") as mock_load:
+            manager.load_model(version=3)
+            mock_load.assert_called_with("models:/test_model/3")
+
+    def test_load_model_by_run_id(self, manager):
+        """Verify URI formatting for run-based loading."""
+        with patch("mlflow.pyfunc.load_model") as mock_load:
+            manager.load_model(run_id="run_42")
+            mock_load.assert_called_with("runs:/run_42/model")
+
+    @pytest.mark.parametrize("identifiers", [{}, {"version": "1", "alias": "production"}])
+    def test_load_model_requires_one_identifier(self, manager, identifiers):
+        """Verify exactly one of version, alias or run_id must be given."""
+        with pytest.raises(ValueError, match="exactly one of"):
+            manager.load_model(**identifiers)
+
+    def test_list_versions_pages(self, manager, mock_mlflow):
+        """Verify every result page is fetched and flattened in order."""
+
+        class Page(list):
+            def __init__(self, versions, token):
+                super().__init__(versions)
+                self.token = token
+
+        def version(number):
+            return MagicMock(version=number, run_id=f"run_{number}", aliases=[])
+
+        mock_mlflow["client"].search_model_versions.side_effect = [
+            Page([version("2"), version("1")], "next"),
+            Page([version("0")], None),
+        ]
+
+        versions = manager.list_versions()
+
+        assert [v["version"] for v in versions] == ["2", "1", "0"]
+        assert set(versions[0]) == {"version", "run_id", "status", "creation_timestamp", "aliases"}
+        assert mock_mlflow["client"].search_model_versions.call_args_list[1].kwargs["page_token"] == "next"
+        assert (
+            mock_mlflow["client"].search_model_versions.call_args.kwargs["filter_string"]
+            == "name='test_model'"
+        )
+
+    def test_load_model_not_cached_by_default(self, manager):
+        """Verify loaded models are only kept in memory when model caching is enabled."""
+        with patch("mlflow.pyfunc.load_model") as mock_load:
+            manager.load_model(version="1")
+            manager.load_model(version="1")
+
+            assert mock_load.call_count == 2
+
+    def test_load_model_cached(self, mock_mlflow):
+        """Verify repeated loads are served from the cache until the alias moves."""
+        manager = MLflowModelManager("test_model", model_cache_size=4)
+        lookup = mock_mlflow["client"].get_model_version_by_alias
+        lookup.return_value = MagicMock(version="2")
+
+        with patch("mlflow.pyfunc.load_model") as mock_load:
+            first = manager.load_model(alias="production")
+            second = manager.load_model(version="2")
+
+            assert first is second
+            mock_load.assert_called_once()
+
+            lookup.return_value = MagicMock(version="3")
+            manager.set_alias(version="3", alias="production")
+            manager.load_model(alias="production")
+
+            mock_load.assert_called_with("models:/test_model/3")
+            assert mock_load.call_count == 2
+
+    def test_load_model_by_alias_steady_state(self, mock_mlflow):
+        """Verify repeated alias loads neither re-resolve the alias nor reload the model."""
+        manager = MLflowModelManager("test_model", model_cache_size=4)
+        lookup = mock_mlflow["client"].get_model_version_by_alias
+        lookup.return_value = MagicMock(version="5")
+
+        with patch("mlflow.pyfunc.load_model") as mock_load:
+            for _ in range(3):
+                manager.load_model(alias="production")
+
+            lookup.assert_called_once_with("test_model", "production")
+            mock_load.assert_called_once_with("models:/test_model/5")
+
+    def test_load_model_cache_expires(self, mock_mlflow):
+        """Verify cached models are reloaded once their TTL passes."""
+        manager = MLflowModelManager("model_a", model_cache_size=4, model_cache_ttl=0)
+
+        with patch("mlflow.pyfunc.load_model") as mock_load:
+            manager.load_model(version="1")
+            manager.load_model(version="1")
+
+            assert mock_load.call_count == 2
+
+    def test_load_model_cache_purges_expired(self, mock_mlflow):
+        """Verify storing a model releases expired entries even if their key isn't requested again."""
+        manager = MLflowModelManager("model_a", model_cache_size=4)
+
+        with patch("mlflow.pyfunc.load_model"), patch("time.monotonic", return_value=0.0) as clock:
+            manager.load_model(version="1")
+            clock.return_value = 301.0
+            manager.load_model(version="2")
+
+        assert list(manager._model_cache) == ["models:/model_a/2"]
+
+    def test_get_model_by_alias_cached(self, manager, mock_mlflow):
+        """Verify alias lookups hit the registry once and return independent copies."""
+        mock_mlflow["client"].get_model_version_by_alias.return_value = MagicMock(version="4", aliases=[])
+
+        first = manager.get_model_by_alias("staging")
+        first["version"] = "changed"
+        second = manager.get_model_by_alias("staging")
+
+        assert second["version"] == "4"
+        mock_mlflow["client"].get_model_version_by_alias.assert_called_once()
+
+    def test_list_versions_server_side_filter(self, manager, mock_mlflow):
+        """Verify filters, ordering and limits are pushed to the server."""
+        page = MagicMock(__iter__=lambda self: iter([MagicMock(version="9")]), __len__=lambda self: 1)
+        page.token = "more"
+        mock_mlflow["client"].search_model_versions.return_value = page
+
+        versions = manager.list_versions(
+            filter_string="tags.stage = 'candidate'", order_by=["version_number DESC"], max_results=1
+        )
+
+        assert [v["version"] for v in versions] == ["9"]
+        mock_mlflow["client"].search_model_versions.assert_called_once_with(
+            filter_string="name='test_model' AND tags.stage = 'candidate'",
+            max_results=1,
+            order_by=["version_number DESC"],
+            page_token=None,
+        )
+
+    def test_list_versions_name_with_quote(self, mock_mlflow):
+        """Verify model names containing quotes still produce a valid filter."""
+        mock_mlflow["client"].search_model_versions.return_value = MagicMock(
+            __iter__=lambda self: iter([]), token=None
+        )
+
+        MLflowModelManager("bettor's model").list_versions()
+
+        assert (
+            mock_mlflow["client"].search_model_versions.call_args.kwargs["filter_string"]
+            == 'name="bettor\'s model"'
+        )
+
+    def test_list_versions_columnar(self, manager, mock_mlflow):
+        """Verify versions are returned as one list per field."""
+        mock_mlflow["client"].search_model_versions.return_value = MagicMock(
+            __iter__=lambda self: iter(
+                [
+                    MagicMock(version="2", run_id="run_2", status="READY", creation_timestamp=20, aliases=[]),
+                    MagicMock(
+                        version="1", run_id="run_1", status="READY", creation_timestamp=10, aliases=["a"]
+                    ),
+                ]
+            ),
+            token=None,
+        )
+
+        columns = manager.list_versions_columnar()
+
+        assert columns == {
+            "version": ["2", "1"],
+            "run_id": ["run_2", "run_1"],
+            "status": ["READY", "READY"],
+            "creation_timestamp": [20, 10],
+            "aliases": [[], ["a"]],
+        }
+
+    def test_list_versions_columnar_empty(self, manager, mock_mlflow):
+        """Verify an empty registry still returns every column."""
+        mock_mlflow["client"].search_model_versions.return_value = MagicMock(
+            __iter__=lambda self: iter([]), token=None
+        )
+
+        columns = manager.list_versions_columnar()
+
+        assert columns == {"version": [], "run_id": [], "status": [], "creation_timestamp": [], "aliases": []}
+
+    def test_get_model_by_alias_registry_error(self, manager, mock_mlflow):
+        """Verify registry failures other than a missing alias are raised."""
+        mock_mlflow["client"].get_model_version_by_alias.side_effect = MlflowException(
+            "rate limited", error_code="REQUEST_LIMIT_EXCEEDED"
+        )
+
+        with pytest.raises(MlflowException, match="rate limited"):
+            manager.get_model_by_alias("production")
+
+    def test_alias_exists(self, manager, mock_mlflow):
+        """Verify alias checks only query registry metadata."""
+        lookup = mock_mlflow["client"].get_model_version_by_alias
+
+        assert manager.alias_exists("production") is True
+
+        lookup.side_effect = MlflowException("missing", error_code="RESOURCE_DOES_NOT_EXIST")
+        assert manager.alias_exists("shadow") is False
+
+        lookup.side_effect = MlflowException("boom")
+        with pytest.raises(MlflowException):
+            manager.alias_exists("shadow")
+
+    def test_alias_exists_populates_alias_cache(self, manager, mock_mlflow):
+        """Verify an alias check followed by a load queries the registry once."""
+        lookup = mock_mlflow["client"].get_model_version_by_alias
+        lookup.return_value = MagicMock(version="4")
+
+        with patch("mlflow.pyfunc.load_model") as mock_load:
+            assert manager.alias_exists("production") is True
+            manager.load_model(alias="production")
+
+        lookup.assert_called_once_with("test_model", "production")
+        mock_load.assert_called_once_with("models:/test_model/4")
+
     def test_promote_to_production(self, manager, mock_mlflow):
         """Verify explicit alias promotion logic."""
         manager.promote_to_production(version="2")
@@ -122,3 +613,32 @@ class TestMLflowModelManager:
         mock_mlflow["client"].set_registered_model_alias.assert_called_with(
             name="test_model", alias="production", version="2"
         )
+
+    def test_promote_to_production_reloads_alias(self, mock_mlflow):
+        """Verify promoting a version makes the next production load pick it up."""
+        manager = MLflowModelManager("test_model", model_cache_size=4)
+        lookup = mock_mlflow["client"].get_model_version_by_alias
+        lookup.return_value = MagicMock(version="1")
+
+        with patch("mlflow.pyfunc.load_model") as mock_load:
+            manager.load_model(alias="production")
+            manager.load_model(alias="production")
+            assert mock_load.call_count == 1
+
+            lookup.return_value = MagicMock(version="2")
+            manager.promote_to_production(version="2")
+            manager.load_model(alias="production")
+
+            mock_load.assert_called_with("models:/test_model/2")
+            assert mock_load.call_count == 2
+
+    def test_promote_many(self, manager, mock_mlflow):
+        """Verify every alias/version pair is assigned, including several aliases on one version."""
+        manager.promote_many({"production": "5", "staging": "5", "shadow": "6"})
+
+        calls = mock_mlflow["client"].set_registered_model_alias.call_args_list
+        assert sorted((c.kwargs["alias"], c.kwargs["version"]) for c in calls) == [
+            ("production", "5"),
+            ("shadow", "6"),
+            ("staging", "5"),
+        ]
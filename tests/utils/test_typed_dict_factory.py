@@ -1,7 +1,23 @@
+import logging
 import unittest
+from functools import cache
+from operator import methodcaller
+from unittest.mock import patch
+
+import pytest
 
 from ssa.utils.typed_dict_factory import ImmutableDict, TypedDictFactory
 
+EXPECTED_US = {"country": "US"}
+EXPECTED_US_VENDOR = {"country": "US", "vendor_id": 12345}
+EXPECTED_BR_VENDOR = {"country": "BR", "vendor_id": 54321}
+
+
+@cache
+def _factory(fields: tuple) -> TypedDictFactory:
+    """Returns a factory for the given attribute shape, built once per test run."""
+    return TypedDictFactory(list(fields))
+
 
 class TestTypedDictFactory(unittest.TestCase):
     """
@@ -9,6 +25,12 @@ class TestTypedDictFactory(unittest.TestCase):
 
     """
 
+    @classmethod
+    def setUpClass(cls):
+        """Build the factories shared by the tests, which are reusable as their instances are immutable."""
+        cls.country_factory = _factory((("country", str),))
+        cls.country_vendor_factory = _factory((("country", str), ("vendor_id", int)))
+
     def test_instance_immutable_dict(self):
         """
         Test creating an instance of ImmutableDict.
@@ -16,22 +38,33 @@ class TestTypedDictFactory(unittest.TestCase):
         This method ensures that the factory correctly creates
         an instance of ImmutableDict.
         """
-        new_factory = TypedDictFactory([("country", str)])
-        instance = new_factory.create_instance(country="US")
+        instance = self.country_factory.create_instance(country="US")
 
         self.assertIsInstance(instance, ImmutableDict)
 
-    def test_immutable_dict_immutable(self):
+    def test_immutable_dict_no_instance_dict(self):
         """
-        Test creating an instance of ImmutableDict with immutable attributes.
+        Test that ImmutableDict instances don't carry an attribute dictionary.
 
-        This method ensures that the ImmutableDict class is immutable.
+        This method ensures that instances only store the dictionary items,
+        keeping their construction as cheap as a plain dict.
         """
-        new_factory = TypedDictFactory([("country", str)])
-        instance = new_factory.create_instance(country="US")
+        instance = self.country_factory.create_instance(country="US")
 
-        with self.assertRaises(TypeError):
-            instance["country"] = "BR"
+        self.assertFalse(hasattr(instance, "__dict__"))
+
+    def test_immutable_dict_equality(self):
+        """
+        Test comparing instances of ImmutableDict.
+
+        This method ensures that instances compare by their items,
+        like a regular dictionary.
+        """
+        self.assertEqual(self.country_factory.create_instance(country="US"), EXPECTED_US)
+        self.assertNotEqual(
+            self.country_factory.create_instance(country="US"),
+            self.country_factory.create_instance(country="BR"),
+        )
 
     def test_attributes_inside_list(self):
         """
@@ -40,10 +73,9 @@ class TestTypedDictFactory(unittest.TestCase):
         This method ensures that the factory correctly creates an instance when
         the required attributes are provided as a list of tuples.
         """
-        new_factory = TypedDictFactory([("country", str)])
-        instance = new_factory.create_instance(country="US")
+        instance = self.country_factory.create_instance(country="US")
 
-        self.assertDictEqual(instance, {"country": "US"})
+        self.assertDictEqual(instance, EXPECTED_US)
 
     def test_additional_attributes(self):
         """
@@ -52,8 +84,7 @@ class TestTypedDictFactory(unittest.TestCase):
         This method ensures that the factory correctly creates an instance when
         additional attributes not defined in the factory are provided.
         """
-        new_factory = TypedDictFactory([("country", str)])
-        instance = new_factory.create_instance(country="US", vendor_id={"mondelez": "12345"})
+        instance = self.country_factory.create_instance(country="US", vendor_id={"mondelez": "12345"})
 
         self.assertDictEqual(instance, {"country": "US", "vendor_id": {"mondelez": "12345"}})
 
@@ -64,13 +95,53 @@ class TestTypedDictFactory(unittest.TestCase):
         This method ensures that the factory correctly creates multiple instances
         when different attribute values are provided.
         """
-        new_factory = TypedDictFactory([("country", str), ("vendor_id", int)])
+        instance1 = self.country_vendor_factory.create_instance(country="US", vendor_id=12345)
+        instance2 = self.country_vendor_factory.create_instance(country="BR", vendor_id=54321)
+
+        self.assertDictEqual(instance1, EXPECTED_US_VENDOR)
+        self.assertDictEqual(instance2, EXPECTED_BR_VENDOR)
+
+    def test_debug_logging_disabled(self):
+        """
+        Test creating an instance when debug logging is disabled.
+
+        This method ensures that the factory doesn't emit debug records
+        on the create_instance path unless debug logging is enabled.
+        """
+        with patch.object(self.country_factory._logger, "debug") as mock_debug:
+            self.country_factory.create_instance(country="US")
+
+        mock_debug.assert_not_called()
 
-        instance1 = new_factory.create_instance(country="US", vendor_id=12345)
-        instance2 = new_factory.create_instance(country="BR", vendor_id=54321)
+    def test_debug_logging_enabled_after_creation(self):
+        """
+        Test creating an instance after debug logging is enabled.
+
+        This method ensures that a factory built before the application
+        configures logging still follows later level changes.
+        """
+        logger = self.country_factory._logger
+        self.addCleanup(logger.setLevel, logger.level)
+        logger.setLevel(logging.DEBUG)
+
+        with patch.object(logger, "debug") as mock_debug:
+            self.country_factory.create_instance(country="US")
+
+        mock_debug.assert_called_once()
+
+    def test_factories_share_logger(self):
+        """
+        Test creating multiple factories.
+
+        This method ensures that factories share a single logger and
+        don't add a new handler for each instance.
+        """
+        new_factory1 = TypedDictFactory([("country", str)])
+        handlers = list(new_factory1._logger.handlers)
+        new_factory2 = TypedDictFactory([("state", str)])
 
-        self.assertDictEqual(instance1, {"country": "US", "vendor_id": 12345})
-        self.assertDictEqual(instance2, {"country": "BR", "vendor_id": 54321})
+        self.assertIs(new_factory1._logger, new_factory2._logger)
+        self.assertEqual(new_factory2._logger.handlers, handlers)
 
     def test_equal_factories(self):
         """
@@ -97,53 +168,26 @@ class TestTypedDictFactory(unittest.TestCase):
         self.assertNotEqual(new_factory1, new_factory2)
         self.assertFalse(new_factory1 == new_factory2)
 
-    def test_no_parameter(self):
+    def test_create_instance_validation(self):
         """
-        Test creating an instance with no parameters.
+        Test creating instances that don't satisfy the factory attributes.
 
-        This method ensures that the factory correctly handles the case when
-        no parameters are provided by returning None.
+        This method ensures that the factory returns None when parameters are
+        missing or have an invalid type, and when the attribute configuration
+        itself is invalid (missing or None types).
         """
-        new_factory = TypedDictFactory([("country", str), ("vendor_id", str)])
-        instance = new_factory.create_instance()
-
-        self.assertIsNone(instance)
-
-    def test_missing_parameter(self):
-        """
-        Test creating an instance with a missing required parameter.
-
-        This method ensures that the factory correctly handles the case when a required
-        parameter is missing by returning None.
-        """
-        new_factory = TypedDictFactory([("country", str), ("vendor_id", str)])
-        instance = new_factory.create_instance(country="US")
-
-        self.assertIsNone(instance)
-
-    def test_invalid_parameter_type(self):
-        """
-        Test creating an instance with an invalid parameter type.
-
-        This method ensures that the factory correctly handles the case when a parameter
-        is provided with an invalid type by returning None.
-        """
-        new_factory = TypedDictFactory([("country", str)])
-        instance = new_factory.create_instance(country=1)
-
-        self.assertIsNone(instance)
-
-    def test_missing_attribute_type(self):
-        """
-        Test creating an instance with a missing attribute type.
-
-        This method ensures that the factory correctly handles the case when an attribute
-        type is missing by returning None.
-        """
-        new_factory = TypedDictFactory([("country")])
-        instance = new_factory.create_instance(country="US")
+        test_cases = [
+            # (fields, kwargs)
+            ((("country", str), ("vendor_id", str)), {}),
+            ((("country", str), ("vendor_id", str)), {"country": "US"}),
+            ((("country", str),), {"country": 1}),
+            (("country",), {"country": "US"}),
+            (((None, None),), {"country": "US"}),
+        ]
 
-        self.assertIsNone(instance)
+        for fields, kwargs in test_cases:
+            with self.subTest(fields=fields, kwargs=kwargs):
+                self.assertIsNone(_factory(fields).create_instance(**kwargs))
 
     def test_no_required_attribute(self):
         """
@@ -163,20 +207,7 @@ class TestTypedDictFactory(unittest.TestCase):
         when positional arguments are provided instead of keyword arguments.
         """
         with self.assertRaises(TypeError):
-            new_factory = TypedDictFactory([("country", str)])
-            new_factory.create_instance("US")
-
-    def test_attributes_none_type(self):
-        """
-        Test creating an instance with attributes of None type.
-
-        This method ensures that the factory correctly handles the case when attributes
-        are provided with None type by returning None.
-        """
-        new_factory = TypedDictFactory([(None, None)])
-        instance = new_factory.create_instance(country="US")
-
-        self.assertIsNone(instance)
+            self.country_factory.create_instance("US")
 
     def test_class_representation(self):
         """
@@ -185,153 +216,63 @@ class TestTypedDictFactory(unittest.TestCase):
         This method ensures that the factory correctly returns a string representation
         of itself when converted to a string.
         """
-        new_factory = TypedDictFactory([("country", str)])
-
         self.assertEqual(
-            str(new_factory),
+            str(self.country_factory),
             "TypedDictFactory with [('country', <class 'str'>)] attributes",
         )
 
-    def test_class_representation_null_object(self):
-        """
-        Test the string representation of the TypedDictFactory
-        class with a null object.
-
-        This method ensures that the factory correctly raises a TypeError when
-        attempting to create a factory instance without required attributes.
-        """
-
-        with self.assertRaises(TypeError):
-            str(TypedDictFactory())
-
-    def test_pop_method(self):
-        """
-        Test the pop method of ImmutableDict.
-
-        This method ensures that the pop method correctly raises a TypeError
-        since the dictionary is immutable.
-        """
-        new_factory = TypedDictFactory([("country", str)])
-        instance = new_factory.create_instance(country="US")
-
-        with self.assertRaises(TypeError):
-            instance.pop("country")
-
-    def test_pop_method_with_default(self):
-        """
-        Test the pop method of ImmutableDict with a default value.
-
-        This method ensures that the pop method correctly raises a TypeError
-        even when a default value is provided, since the dictionary is immutable.
-        """
-        new_factory = TypedDictFactory([("country", str)])
-        instance = new_factory.create_instance(country="US")
-
-        with self.assertRaises(TypeError):
-            instance.pop("country", "default_value")
-
-    def test_popitem_method(self):
-        """
-        Test the popitem method of ImmutableDict.
-
-        This method ensures that the popitem method correctly raises a TypeError
-        since the dictionary is immutable.
-        """
-        new_factory = TypedDictFactory([("country", str), ("vendor_id", int)])
-        instance = new_factory.create_instance(country="US", vendor_id=12345)
-
-        with self.assertRaises(TypeError):
-            instance.popitem()
-
     def test_repr_method(self):
         """
-        Test the __repr__ method of ImmutableDict.
+        Test the __repr__ and __str__ methods of ImmutableDict.
 
-        This method ensures that the __repr__ method correctly returns
-        a string representation of the dictionary.
+        This method ensures that both methods return the same string
+        representation of the dictionary.
         """
-        new_factory = TypedDictFactory([("country", str), ("vendor_id", int)])
-        instance = new_factory.create_instance(country="US", vendor_id=12345)
+        instance = self.country_vendor_factory.create_instance(country="US", vendor_id=12345)
 
         expected_repr = "{'country': 'US', 'vendor_id': 12345}"
         self.assertEqual(repr(instance), expected_repr)
+        self.assertEqual(str(instance), repr(instance))
+        self.assertNotEqual(str(instance), "{'country': 'US', 'vendor_id': 123456}")
+
+
+@pytest.fixture(scope="module")
+def immutable_instance():
+    """ImmutableDict shared by the immutability tests, which never manage to modify it."""
+    return _factory((("country", str), ("vendor_id", int))).create_instance(country="US", vendor_id=12345)
+
+
+@pytest.mark.parametrize(
+    "operation",
+    [
+        methodcaller("pop", "country"),
+        methodcaller("pop", "country", "default"),
+        methodcaller("popitem"),
+        methodcaller("clear"),
+        methodcaller("__delitem__", "country"),
+        methodcaller("__setitem__", "new_key", "new_value"),
+        methodcaller("__setitem__", "country", "BR"),
+        methodcaller("update", {"new_key": "new_value"}),
+    ],
+    ids=[
+        "pop",
+        "pop_default",
+        "popitem",
+        "clear",
+        "delitem",
+        "setitem_new_key",
+        "setitem_existing_key",
+        "update",
+    ],
+)
+def test_immutable_behavior_consistency(immutable_instance, operation):
+    """
+    Test that all modification methods consistently raise TypeError.
 
-    def test_str_method(self):
-        """
-        Test the __str__ method of ImmutableDict.
-
-        This method ensures that the __str__ method correctly returns
-        a string representation of the dictionary.
-        """
-        new_factory = TypedDictFactory([("country", str), ("vendor_id", int)])
-        instance = new_factory.create_instance(country="US", vendor_id=12345)
-
-        expected_str = "{'country': 'US', 'vendor_id': 12345}"
-        self.assertEqual(str(instance), expected_str)
-
-    def test_str_method_neq(self):
-        """
-        Test the __str__ method of ImmutableDict.
-
-        This method ensures that the __str__ method correctly returns
-        a string representation of the dictionary.
-        """
-        new_factory = TypedDictFactory([("country", str), ("vendor_id", int)])
-        instance = new_factory.create_instance(country="US", vendor_id=12345)
-
-        incorrect_str = "{'country': 'US', 'vendor_id': 123456}"
-        self.assertNotEqual(str(instance), incorrect_str)
-
-    def test_delitem_method(self):
-        """
-        Test the __delitem__ method of ImmutableDict.
-
-        This method ensures that the __delitem__ method correctly raises a TypeError
-        since the dictionary is immutable.
-        """
-        new_factory = TypedDictFactory([("country", str)])
-        instance = new_factory.create_instance(country="US")
-
-        with self.assertRaises(TypeError):
-            del instance["country"]
-
-    def test_clear_method(self):
-        """
-        Test the clear method of ImmutableDict.
-
-        This method ensures that the clear method correctly raises a TypeError
-        since the dictionary is immutable.
-        """
-        new_factory = TypedDictFactory([("country", str), ("vendor_id", int)])
-        instance = new_factory.create_instance(country="US", vendor_id=12345)
-
-        with self.assertRaises(TypeError):
-            instance.clear()
-
-    def test_immutable_behavior_consistency(self):
-        """
-        Test that all modification methods consistently raise TypeError.
-
-        This method ensures that all methods that could modify the dictionary
-        consistently raise TypeError, maintaining the immutable behavior.
-        """
-        new_factory = TypedDictFactory([("country", str), ("vendor_id", int)])
-        instance = new_factory.create_instance(country="US", vendor_id=12345)
-
-        # Test all modification methods
-        modification_methods = [
-            lambda: instance.pop("country"),
-            lambda: instance.pop("country", "default"),
-            lambda: instance.popitem(),
-            lambda: instance.clear(),
-            lambda: instance.__delitem__("country"),
-            lambda: instance.__setitem__("new_key", "new_value"),
-            lambda: instance.update({"new_key": "new_value"}),
-        ]
-
-        for method in modification_methods:
-            with self.assertRaises(TypeError):
-                method()
+    This test ensures that all methods that could modify the dictionary
+    consistently raise TypeError, leaving the original data unchanged.
+    """
+    with pytest.raises(TypeError):
+        operation(immutable_instance)
 
-        # Verify the original data is unchanged
-        self.assertDictEqual(instance, {"country": "US", "vendor_id": 12345})
+    assert immutable_instance == EXPECTED_US_VENDOR